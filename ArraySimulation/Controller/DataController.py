@@ -70,6 +70,8 @@ For now, we only have two types of simulations that we want to simulate.
     across a set of modules.
 """
 # Library Imports.
+from functools import lru_cache
+import numpy as np
 
 # Custom Imports.
 from ArraySimulation.DCDCConverter.DCDCConverter import DCDCConverter
@@ -93,18 +95,38 @@ class DataController:
 
         The datastore is in the following format:
         {
-            "cycle": [],        # List of integers
-            "sourceDef": [],    # List of source environment definitions
-            "sourceOutput: [],  # List of dicts in the following format:
-                                    {
-                                        "current": float,
-                                        "IV": list of voltage/current tuples,
-                                        "edge": tuple (V_OC, I_SC, (V_MPP, I_MPP))
-                                    }
-            "mpptOutput": [],   # List of reference voltages
-            "dcdcOutput": [],   # List of output Pulse Widths
+            "cycle": ndarray,       # int32 cycle number of each entry.
+            "sourceDef": ndarray,   # float32 (N, numModules, 3) rows of
+                                      (voltage, irradiance, temperature)
+                                      for each module of each cycle.
+            "sourceOutput": {
+                "current": ndarray, # float32 source current of each cycle.
+                "IV": ndarray,      # float32 (N, 2) pool of voltage/current
+                                      pairs of every cycle, concatenated.
+                "IVOffsets": ndarray,
+                                    # int32 offsets into the IV pool. The I-V
+                                      curve of cycle i is found at
+                                      IV[IVOffsets[i]:IVOffsets[i + 1]].
+                "edge": ndarray,    # float32 (N, 4) rows of
+                                      (V_OC, I_SC, V_MPP, I_MPP).
+            },
+            "mpptOutput": ndarray,  # float32 reference voltages
+            "dcdcOutput": ndarray,  # float32 output Pulse Widths
+            "maxCycle": int,
         }
 
+        Each column is preallocated for the maximum number of cycles and
+        written by cycle index; only the first numCycles entries are valid.
+        See getCycles(), getCurrents(), etc. for views of the valid entries.
+
+        Stored quantities are float32, which halves the footprint of the
+        datastore relative to Python floats and float64. float32 carries ~7
+        significant digits (a relative precision floor of ~1e-7, or ~1e-6 after
+        accumulated rounding), well below the 0.01 V and 0.001 A resolution of
+        the source models. The simulation itself still runs in float64; only
+        the stored results are downcast, so the reference voltage fed back
+        into the next cycle is not rounded.
+
         Based on what is requested, not all of these parameters will have to be
         filled in.
         """
@@ -115,18 +137,61 @@ class DataController:
         self._DCDCConverter = DCDCConverter()
 
         # Data storage.
-        self.datastore = {
-            "cycle": [],
-            "sourceDef": [],
-            "sourceOutput": [],
-            "mpptOutput": [],
-            "dcdcOutput": [],
-            "maxCycle": 200,
-        }
+        self._allocateDatastore(200, 1, 1)
 
-        # The reference voltage applied at the start of every cycle.
+        # The reference voltage applied at the start of every cycle. Kept as a
+        # float64 Python float, not read back from the float32 datastore.
         self._vREF = 0.0
 
+        # Memo of source curves generated by generateSourceCurve, keyed on the
+        # curve parameters.
+        self._sourceCurveCache = lru_cache(maxsize=256)(self._generateSourceCurve)
+
+    def _allocateDatastore(self, maxCycles, numCells, numModules):
+        """
+        Preallocates the column arrays of the datastore.
+
+        Parameters
+        ----------
+        maxCycles: Int
+            Maximum number of cycles to execute for.
+        numCells: Int
+            Number of cells in the source. Determines the maximum number of
+            points in each I-V curve.
+        numModules: Int
+            Number of modules in the source.
+        """
+        # Cycles are inclusive of maxCycles.
+        numEntries = maxCycles + 1
+
+        # Number of points generated by PVSource.getIV() at its default
+        # resolution, with some slack for floating point error in np.arange.
+        maxPts = int(round(PVSource.MAX_CELL_VOLTAGE * numCells / 0.01)) + 2
+
+        self._numCycles = 0
+        self._cycle = np.empty(numEntries, np.int32)
+        self._current = np.empty(numEntries, np.float32)
+        self._edge = np.empty((numEntries, 4), np.float32)
+        self._vRef = np.empty(numEntries, np.float32)
+        self._pulseWidth = np.empty(numEntries, np.float32)
+        self._ivPool = np.empty((numEntries * maxPts, 2), np.float32)
+        self._ivOff = np.zeros(numEntries + 1, np.int32)
+        self._modDef = np.empty((numEntries, numModules, 3), np.float32)
+
+        self.datastore = {
+            "cycle": self._cycle,
+            "sourceDef": self._modDef,
+            "sourceOutput": {
+                "current": self._current,
+                "IV": self._ivPool,
+                "IVOffsets": self._ivOff,
+                "edge": self._edge,
+            },
+            "mpptOutput": self._vRef,
+            "dcdcOutput": self._pulseWidth,
+            "maxCycle": maxCycles,
+        }
+
     # Simulation pipeline management.
     def resetPipeline(
         self, modelType, environment, maxCycles, MPPTGlobalAlgo, MPPTLocalAlgo, MPPTStrideAlgo
@@ -143,25 +208,22 @@ class DataController:
             PVEnvironment model used.
         maxCycles: Int
             Maximum number of cycles to execute for.
-        MPPTGlobalAlgo: String
+        MPPTGlobalAlgo: GlobalMPPTType
             The global MPPT algorithm type.
-        MPPTAlgo: String
+        MPPTLocalAlgo: LocalMPPTType
             The local MPPT algorithm type.
-        MPPTStrideAlgo: String
+        MPPTStrideAlgo: StrideType
             The stride MPPT algorithm type.
         """
-        self.datastore = {
-            "cycle": [],
-            "sourceDef": [],
-            "sourceOutput": [],
-            "mpptOutput": [],
-            "dcdcOutput": [],
-            "maxCycle": maxCycles,
-        }
-
-        self._PVEnv.setupModel(source=environment, maxCycles=self.datastore["maxCycle"])
+        self._PVEnv.setupModel(source=environment, maxCycles=maxCycles)
         self._PVSource.setupModel(modelType=modelType)
 
+        self._allocateDatastore(
+            maxCycles,
+            self._PVEnv.getSourceNumCells(),
+            self._PVEnv.getSourceNumModules(),
+        )
+
         self._MPPT.setupModel(
             numCells=self._PVEnv.getSourceNumCells(),
             MPPTGlobalAlgoType=MPPTGlobalAlgo,
@@ -176,49 +238,118 @@ class DataController:
         """
         Runs an entire cycle through the pipeline, using components required for
         a MPPT Simulation.
+
+        Return
+        ------
+        tuple: (datastore: Dict, continueBool: bool)
+            The datastore and whether there are any cycles left to execute.
         """
-        # Get the current simulation cycle.
-        cycle = self._PVEnv.getCycle()
+        return self._executeCyclesMPPT(1)
 
-        # Retrieve the source definition for the current simulation cycle.
-        modulesDef = self._PVEnv.getSourceDefinition(self._vREF)
-        numCells = self._PVEnv.getSourceNumCells()
-        envDef = self._PVEnv.getSourceEnvironmentDefinition()
-
-        # Retrieve the source characteristics given the source definition.
-        sourceCurrent = self._PVSource.getSourceCurrent(modulesDef)
-        sourceIV = self._PVSource.getIV(modulesDef, numCells)
-        sourceEdgeChar = self._PVSource.getEdgeCharacteristics(modulesDef, numCells)
-
-        # Retrieve the MPPT VREF guess given the source output current.
-        print(cycle, end='\t')
-        vRef = self._MPPT.getReferenceVoltage(
-            self._vREF,
-            sourceCurrent,
-            envDef["irradiance"],
-            envDef["temperature"],
-        )
+    def runPipelineMPPT(self):
+        """
+        Runs every remaining cycle through the pipeline in a single call, using
+        components required for a MPPT Simulation. Use this over
+        iteratePipelineCycleMPPT() when intermediate results do not need to be
+        displayed.
+
+        Return
+        ------
+        Dict: The datastore.
+        """
+        (datastore, _) = self._executeCyclesMPPT(None)
+        return datastore
 
-        # Generate the pulsewidth of the DC-DC Converter and spit it back out.
-        self._DCDCConverter.setPulseWidth(vRef)
-        pulseWidth = self._DCDCConverter.getPulseWidth()
+    def _executeCyclesMPPT(self, numCycles):
+        """
+        Runs cycles through the pipeline until numCycles have been executed or
+        the environment runs out of cycles.
 
-        # Store our output into our datastore.
-        self.datastore["cycle"].append(cycle)
-        self.datastore["sourceDef"].append(modulesDef)
-        self.datastore["sourceOutput"].append(
-            {"current": sourceCurrent, "IV": sourceIV, "edge": sourceEdgeChar}
-        )
-        self.datastore["mpptOutput"].append(vRef)
-        self.datastore["dcdcOutput"].append(pulseWidth)
+        Parameters
+        ----------
+        numCycles: int or None
+            Number of cycles to execute. None executes all remaining cycles.
 
-        # Assign the VREF to apply across the source in the next simulation cycle.
-        self._vREF = vRef
+        Return
+        ------
+        tuple: (datastore: Dict, continueBool: bool)
+            The datastore and whether there are any cycles left to execute.
+        """
+        # Bind the methods called every cycle once, outside of the loop.
+        getCycle = self._PVEnv.getCycle
+        getSourceDefinition = self._PVEnv.getSourceDefinition
+        getSourceEnvironmentDefinition = self._PVEnv.getSourceEnvironmentDefinition
+        incrementCycle = self._PVEnv.incrementCycle
+        getSourceCurrent = self._PVSource.getSourceCurrent
+        getIV = self._PVSource.getIV
+        getEdgeCharacteristicsFromIV = self._PVSource.getEdgeCharacteristicsFromIV
+        getReferenceVoltage = self._MPPT.getReferenceVoltage
+        setPulseWidth = self._DCDCConverter.setPulseWidth
+        getPulseWidth = self._DCDCConverter.getPulseWidth
+        numCells = self._PVEnv.getSourceNumCells()
 
-        # Increment the current simulation cycle.
         continueBool = True
-        if not self._PVEnv.incrementCycle():
-            continueBool = False
+        executed = 0
+        while continueBool and (numCycles is None or executed < numCycles):
+            # Get the current simulation cycle.
+            cycle = getCycle()
+
+            # Retrieve the source definition for the current simulation cycle.
+            modulesDef = getSourceDefinition(self._vREF)
+            envDef = getSourceEnvironmentDefinition()
+
+            # Record the source definition for the cycle.
+            for (idx, module) in enumerate(modulesDef.values()):
+                self._modDef[cycle, idx] = (
+                    module["voltage"],
+                    module["irradiance"],
+                    module["temperature"],
+                )
+
+            # Retrieve the source characteristics given the source definition.
+            sourceCurrent = getSourceCurrent(modulesDef)
+            sourceIV = getIV(modulesDef, numCells)
+            sourceEdgeChar = getEdgeCharacteristicsFromIV(sourceIV)
+
+            # Retrieve the MPPT VREF guess given the source output current.
+            vRef = getReferenceVoltage(
+                self._vREF,
+                sourceCurrent,
+                envDef["irradiance"],
+                envDef["temperature"],
+            )
+
+            # Generate the pulsewidth of the DC-DC Converter and spit it back
+            # out.
+            setPulseWidth(vRef)
+            pulseWidth = getPulseWidth()
+
+            # Store our output into our datastore.
+            start = self._ivOff[cycle]
+            end = start + len(sourceIV)
+            self._ivPool[start:end] = sourceIV
+            self._ivOff[cycle + 1] = end
+
+            self._cycle[cycle] = cycle
+            self._current[cycle] = sourceCurrent
+            self._edge[cycle] = (
+                sourceEdgeChar[0],
+                sourceEdgeChar[1],
+                sourceEdgeChar[2][0],
+                sourceEdgeChar[2][1],
+            )
+            self._vRef[cycle] = vRef
+            self._pulseWidth[cycle] = pulseWidth
+            self._numCycles = cycle + 1
+
+            # Assign the VREF to apply across the source in the next simulation
+            # cycle.
+            self._vREF = vRef
+
+            # Increment the current simulation cycle.
+            if not incrementCycle():
+                continueBool = False
+            executed += 1
 
         return (self.datastore, continueBool)
 
@@ -244,7 +375,8 @@ class DataController:
             PVEnvironment temperature.
         voltageResolution: float
             Voltage resolution step for the I-V curve (controls how many points
-            will be plotted).
+            will be plotted). Not yet supported; like PVSource.getIV(), curves
+            are always sampled every 0.01V.
         modelType: String
             Selects what the cell model type is.
         useLookup: bool
@@ -252,8 +384,32 @@ class DataController:
 
         Returns
         -------
-        A tuple of x and y coordinate attributes, corresponding to the voltage
-        and current pairs of the I-V curve.
+        A tuple of x and y coordinate float32 ndarrays, corresponding to the
+        voltage and current pairs of the I-V curve. The arrays are read-only.
+
+        Curves are memoized on their parameters, with irradiance and
+        temperature rounded to 3 decimal places. voltageResolution is not part
+        of the key, since it does not change the curve. On a repeated call the
+        PVEnvironment and PVSource are not set up again.
+        """
+        return self._sourceCurveCache(
+            int(numCells),
+            round(float(irradiance), 3),
+            round(float(temperature), 3),
+            modelType,
+            bool(useLookup),
+        )
+
+    def _generateSourceCurve(
+        self, numCells, irradiance, temperature, modelType, useLookup
+    ):
+        """
+        Uncached implementation of generateSourceCurve.
+
+        Returns
+        -------
+        A tuple of x and y coordinate read-only float32 ndarrays, corresponding
+        to the voltage and current pairs of the I-V curve.
         """
         # Setup the PVEnvironment.
         # We don't care about the max cycles in this case.
@@ -262,17 +418,97 @@ class DataController:
         # Setup the PVSource.
         self._PVSource.setupModel(modelType, useLookup)
 
-        # Extract the I-V and P-V curve from the source.
-        # We don't care about the voltage input in this case (since we grab the
-        # entire I-V curve, which iterates over all voltages).
+        # Extract the I-V and P-V curve from the source. The whole voltage
+        # range is evaluated in bulk, over the same voltages as getIV().
+        # We don't care about the voltage input in this case.
         modulesDef = self._PVEnv.getSourceDefinition(0.0)
-        IVCoordinates = self._PVSource.getIV(modulesDef, numCells, voltageResolution)
+        voltages = self._PVSource.getIVVoltages(numCells)
+        currents = self._PVSource.getSourceCurrents(modulesDef, voltages)
 
         # Parse it into a format directly ingestable by the UIController.
-        xVals = []
-        yVals = []
-        for coordinate in IVCoordinates:
-            xVals.append(coordinate[0])
-            yVals.append(coordinate[1])
+        # Columns are frozen, since cached curves are shared between callers.
+        voltages = voltages.astype(np.float32)
+        currents = currents.astype(np.float32)
+        voltages.flags.writeable = False
+        currents.flags.writeable = False
+
+        return (voltages, currents)
+
+    def getCycles(self):
+        """
+        Returns the cycles executed by the MPPT simulation so far.
+
+        Return
+        ------
+        ndarray: int32 view of the cycle column.
+        """
+        return self._cycle[: self._numCycles]
+
+    def getCurrents(self):
+        """
+        Returns the source current of each cycle executed so far.
+
+        Return
+        ------
+        ndarray: float32 view of the source current column.
+        """
+        return self._current[: self._numCycles]
+
+    def getReferenceVoltages(self):
+        """
+        Returns the MPPT reference voltage of each cycle executed so far.
+
+        Return
+        ------
+        ndarray: float32 view of the reference voltage column.
+        """
+        return self._vRef[: self._numCycles]
 
-        return (xVals, yVals)
+    def getPulseWidths(self):
+        """
+        Returns the DC-DC converter pulse width of each cycle executed so far.
+
+        Return
+        ------
+        ndarray: float32 view of the pulse width column.
+        """
+        return self._pulseWidth[: self._numCycles]
+
+    def getEdgeCharacteristics(self):
+        """
+        Returns the source edge characteristics of each cycle executed so far.
+
+        Return
+        ------
+        ndarray: float32 (numCycles, 4) view, where each row is
+            (V_OC, I_SC, V_MPP, I_MPP).
+        """
+        return self._edge[: self._numCycles]
+
+    def getSourceDefinitions(self):
+        """
+        Returns the module definitions of each cycle executed so far.
+
+        Return
+        ------
+        ndarray: float32 (numCycles, numModules, 3) view of the (voltage,
+        irradiance, temperature) of each module. For example, [:, :, 1] is
+        the irradiance over time of every module.
+        """
+        return self._modDef[: self._numCycles]
+
+    def getSourceIV(self, cycle):
+        """
+        Returns the source I-V curve of a cycle executed so far.
+
+        Parameters
+        ----------
+        cycle: int
+            Cycle to retrieve the I-V curve for.
+
+        Return
+        ------
+        ndarray: float32 (numPoints, 2) view, where each row is a
+            (voltage, current) pair.
+        """
+        return self._ivPool[self._ivOff[cycle] : self._ivOff[cycle + 1]]
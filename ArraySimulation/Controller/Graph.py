@@ -11,7 +11,7 @@ displaying series data over an independent axis, like time. Axes properties,
 labels, and number of elements displayed at one time is defined at declaration.
 """
 # Library Imports.
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtWidgets import QGridLayout, QLabel, QVBoxLayout, QWidget
 from pyqtgraph import PlotWidget, plot
 import pyqtgraph as pg
@@ -43,6 +43,11 @@ class Graph(View):
         "default": (255, 255, 255),
     }
 
+    # Initial number of points each series buffer can hold. Buffers are grown
+    # when this is exceeded. Buffers are float32; ~7 significant digits is
+    # beyond what can be resolved on screen.
+    _BUFFER_CAPACITY = 256
+
     def __init__(
         self,
         series,
@@ -89,7 +94,10 @@ class Graph(View):
 
 
             The reference defines how the graph should be formatted and provides
-            the storage for adding new data with the update() method.
+            the initial data of each series. The initial x and y data are copied
+            into preallocated float32 NumPy buffers, indexed by the position of
+            the series in the list, of which only the first N points are
+            displayed.
         graphType: String
             The type of graph. Either a line graph or scatter plot.
         title: String
@@ -114,8 +122,27 @@ class Graph(View):
         # Dependent axis label.
         self._yAxisLabel = yAxisLabel
 
-        # Reference to the graph for easy modification.
-        self._graph = {}
+        # Per series state, indexed by the integer ID of the series. The
+        # series name is translated to its ID once per call.
+        self._seriesIndex = {}
+        # x and y data buffers.
+        self._bufX = []
+        self._bufY = []
+        # Number of valid data points in each buffer.
+        self._counts = []
+        self._multipliers = []
+        # Reference to the graph item of each series for easy modification.
+        self._graph = []
+
+        for seriesName in self._series["list"]:
+            self._initBuffers(seriesName)
+
+        # IDs of series whose buffers changed since the last redraw. Updates
+        # are pushed to pyqtgraph once per frame instead of once per data point.
+        self._dirty = set()
+        self._flushTimer = QTimer()
+        self._flushTimer.timeout.connect(self._flush)
+        self._flushTimer.start(int(self._SECOND / self._framerate))
 
         self.updateUI()
 
@@ -137,16 +164,16 @@ class Graph(View):
         -----------
         Datapoints are inserted IN ORDER. We aren't doing any sorting for you.
         """
-        if series in self._series:
-            self._series[series]["data"]["x"].append(datapointX)
-            self._series[series]["data"]["y"].append(
-                datapointY * self._series[series]["multiplier"]
-            )
+        i = self._seriesIndex.get(series)
+        if i is not None:
+            n = self._counts[i]
+            self._reserve(i, n + 1)
 
-            self._graph[series].setData(
-                x=self._series[series]["data"]["x"],
-                y=self._series[series]["data"]["y"],
-            )
+            self._bufX[i][n] = datapointX
+            self._bufY[i][n] = datapointY * self._multipliers[i]
+            self._counts[i] = n + 1
+
+            self._dirty.add(i)
 
     def addPoints(self, series, datapointsX, datapointsY):
         """
@@ -158,25 +185,30 @@ class Graph(View):
         series: String
             ID of the series that should exist in self._series where the data
             points should be inserted.
-        datapointX: int, float
+        datapointX: list, ndarray
             X value list of datapoints. Can be either floats or integers.
-        datapointY: int, float
+        datapointY: list, ndarray
             Y value list of datapoints. Can be either floats or integers.
 
         Assumptions
         -----------
         Datapoints are inserted IN ORDER. We aren't doing any sorting for you.
         """
-        if series in self._series:
-            self._series[series]["data"]["x"] += datapointsX
-            modifier = self._series[series]["multiplier"]
-            modifiedDatapointsY = [datapointY * modifier for datapointY in datapointsY]
-            self._series[series]["data"]["y"] += modifiedDatapointsY
+        i = self._seriesIndex.get(series)
+        if i is not None:
+            datapointsX = np.asarray(datapointsX, dtype=np.float32)
+            datapointsY = np.asarray(datapointsY, dtype=np.float32)
 
-            self._graph[series].setData(
-                x=self._series[series]["data"]["x"],
-                y=self._series[series]["data"]["y"],
-            )
+            n = self._counts[i]
+            k = len(datapointsX)
+            self._reserve(i, n + k)
+
+            # Copy and scale straight into the buffers.
+            np.copyto(self._bufX[i][n : n + k], datapointsX)
+            np.multiply(datapointsY, self._multipliers[i], out=self._bufY[i][n : n + k])
+            self._counts[i] = n + k
+
+            self._dirty.add(i)
 
     def addSeries(self, series, seriesDict):
         """
@@ -204,39 +236,9 @@ class Graph(View):
         """
         self._series[series] = seriesDict
         self._series["list"].append(series)
+        i = self._initBuffers(series)
 
-        # Apply multiplier to value.
-        for n, y in enumerate(self._series[series]["data"]["y"]):
-            self._series[series]["data"]["y"][n] *= self._series[series]["multiplier"]
-
-        if self._graphType == "Line":
-            self._graph[series] = self.plt.plot(
-                x=self._series[series]["data"]["x"],
-                y=self._series[series]["data"]["y"],
-                pen=pg.mkPen(
-                    (
-                        self._series[series]["color"][0],
-                        self._series[series]["color"][1],
-                        self._series[series]["color"][2],
-                    ),
-                    width=1.5,
-                ),
-                name=self._series[series].get("label"),
-            )
-        elif self._graphType == "Scatter":
-            self._graph[series] = pg.ScatterPlotItem(
-                x=self._series[series]["data"]["x"],
-                y=self._series[series]["data"]["y"],
-                pen=pg.mkPen(None),
-                brush=pg.mkBrush(
-                    self._series[series]["color"][0],
-                    self._series[series]["color"][1],
-                    self._series[series]["color"][2],
-                ),
-                size=4,
-                name=self._series[series].get("label"),
-            )
-            self.plt.addItem(self._graph[series])
+        self._createPlotItem(i, series)
 
     def setPoint(self, series, idx, datapointX, datapointY):
         """
@@ -260,14 +262,20 @@ class Graph(View):
         -----------
         Datapoints are inserted IN ORDER. We aren't doing any sorting for you.
         """
-        if series in self._series:
-            self._series[series]["data"]["x"][idx] = datapointX
-            self._series[series]["data"]["y"][idx] = datapointY
+        i = self._seriesIndex.get(series)
+        if i is not None:
+            # Index the valid data points only, like the lists the buffers
+            # replaced; the spare capacity past them would otherwise hide bad
+            # indices.
+            n = self._counts[i]
+            (bufX, bufY) = (self._bufX[i][:n], self._bufY[i][:n])
 
-            self._graph[series].setData(
-                x=self._series[series]["data"]["x"],
-                y=self._series[series]["data"]["y"],
-            )
+            # Write in place; the buffers are the arrays pyqtgraph is given on
+            # the next flush, so no other points are touched.
+            bufX[idx] = datapointX
+            bufY[idx] = datapointY
+
+            self._dirty.add(i)
 
     def clearSeries(self, series):
         """
@@ -278,27 +286,186 @@ class Graph(View):
         series: String
             ID of the series that should be cleared.
         """
-        if series in self._series:
-            self._series[series]["data"]["x"].clear()
-            self._series[series]["data"]["y"].clear()
-
-            self._graph[series].setData(
-                x=self._series[series]["data"]["x"],
-                y=self._series[series]["data"]["y"],
-            )
+        i = self._seriesIndex.get(series)
+        if i is not None:
+            self._counts[i] = 0
+            self._dirty.add(i)
 
     def clearAllSeries(self):
         """
         Erases all data points from all data series.
         """
-        for series in self._series["list"]:
-            self._series[series]["data"]["x"].clear()
-            self._series[series]["data"]["y"].clear()
+        for i in range(len(self._counts)):
+            self._counts[i] = 0
+            self._dirty.add(i)
+
+    def flushNow(self):
+        """
+        Immediately redraws every series modified since the last frame instead
+        of waiting for the flush timer.
+        """
+        self._flush()
+
+    def _flush(self):
+        """
+        Pushes the buffers of all modified series to pyqtgraph. Executed by the
+        flush timer once per frame.
+        """
+        for i in self._dirty:
+            (x, y) = self._getData(i)
+            self._graph[i].setData(x=x, y=y)
+        self._dirty.clear()
+
+    def _createPlotItem(self, i, series):
+        """
+        Applies the multiplier to the initial data of a series and adds a plot
+        item displaying it to the graph.
 
-            self._graph[series].setData(
-                x=self._series[series]["data"]["x"],
-                y=self._series[series]["data"]["y"],
+        Parameters
+        ----------
+        i: int
+            Integer ID of the series.
+        series: String
+            ID of the series that should exist in self._series.
+        """
+        self._applyMultiplier(i)
+
+        (x, y) = self._getData(i)
+        seriesDict = self._series[series]
+
+        if self._graphType == "Line":
+            item = self.plt.plot(
+                x=x,
+                y=y,
+                pen=self._getPen(series),
+                name=seriesDict.get("label"),
+            )
+        elif self._graphType == "Scatter":
+            item = pg.ScatterPlotItem(
+                x=x,
+                y=y,
+                pen=pg.mkPen(None),
+                brush=pg.mkBrush(
+                    seriesDict["color"][0],
+                    seriesDict["color"][1],
+                    seriesDict["color"][2],
+                ),
+                size=seriesDict.get("size", 4),
+                name=seriesDict.get("label", "Undefined Label"),
             )
+            self.plt.addItem(item)
+        else:
+            raise Exception("Invalid graph type:", self._graphType)
+
+        self._graph.append(item)
+
+    def _initBuffers(self, series):
+        """
+        Assigns an integer ID to a series and copies its initial data into
+        preallocated float32 buffers.
+
+        Parameters
+        ----------
+        series: String
+            ID of the series that should exist in self._series.
+
+        Return
+        ------
+        int: The integer ID of the series.
+        """
+        seriesDict = self._series[series]
+        x = np.asarray(seriesDict["data"]["x"], dtype=np.float32)
+        y = np.asarray(seriesDict["data"]["y"], dtype=np.float32)
+        n = len(x)
+
+        capacity = max(Graph._BUFFER_CAPACITY, n)
+        bufX = np.empty(capacity, dtype=np.float32)
+        bufY = np.empty(capacity, dtype=np.float32)
+        bufX[:n] = x
+        bufY[:n] = y
+
+        i = len(self._counts)
+        self._seriesIndex[series] = i
+        self._bufX.append(bufX)
+        self._bufY.append(bufY)
+        self._counts.append(n)
+        self._multipliers.append(seriesDict["multiplier"])
+        return i
+
+    def _reserve(self, i, size):
+        """
+        Grows the buffers of a series such that they can hold at least size
+        data points. Capacity is at least doubled on growth to amortize the
+        copy.
+
+        Parameters
+        ----------
+        i: int
+            Integer ID of the series.
+        size: int
+            Number of data points the buffers should be able to hold.
+        """
+        capacity = len(self._bufX[i])
+        if size > capacity:
+            capacity = max(size, 2 * capacity)
+            self._bufX[i] = np.resize(self._bufX[i], capacity)
+            self._bufY[i] = np.resize(self._bufY[i], capacity)
+
+    def _getPen(self, series):
+        """
+        Returns the line pen for a series. Series that define a color get a pen
+        of that color, otherwise the pen from SERIES_COLOR_SET is used.
+
+        Parameters
+        ----------
+        series: String
+            ID of the series that should exist in self._series.
+
+        Return
+        ------
+        A cached pg.mkPen object.
+        """
+        color = self._series[series].get("color")
+        if color is None:
+            return _QPEN_BY_SERIES.get(series, _QPEN_BY_SERIES["default"])
+
+        color = tuple(color)
+        pen = _QPEN_BY_COLOR.get(color)
+        if pen is None:
+            pen = pg.mkPen(color, width=1.5)
+            _QPEN_BY_COLOR[color] = pen
+        return pen
+
+    def _applyMultiplier(self, i):
+        """
+        Scales the valid y data points of a series by its multiplier in place.
+
+        Parameters
+        ----------
+        i: int
+            Integer ID of the series.
+        """
+        n = self._counts[i]
+        if n > 0:
+            y = self._bufY[i][:n]
+            np.multiply(y, self._multipliers[i], out=y)
+
+    def _getData(self, i):
+        """
+        Returns views of the valid data points of a series.
+
+        Parameters
+        ----------
+        i: int
+            Integer ID of the series.
+
+        Return
+        ------
+        A tuple of x and y ndarray views of length N, the number of data points
+        in the series.
+        """
+        n = self._counts[i]
+        return (self._bufX[i][:n], self._bufY[i][:n])
 
     def updateUI(self):
         """
@@ -319,50 +486,8 @@ class Graph(View):
             self.plt.setLabel("left", self._yAxisLabel)
             self.plt.addLegend()
 
-            for series in self._series["list"]:
-                # Apply multiplier to value.
-                for n, y in enumerate(self._series[series]["data"]["y"]):
-                    self._series[series]["data"]["y"][n] *= self._series[series][
-                        "multiplier"
-                    ]
-
-                if self._graphType == "Line":
-                    # Get pen color.
-                    penColor = self.SERIES_COLOR_SET["default"]
-                    if series in self.SERIES_COLOR_SET:
-                        penColor = self.SERIES_COLOR_SET[series]
-
-                    self._graph[series] = self.plt.plot(
-                        x=self._series[series]["data"]["x"],
-                        y=self._series[series]["data"]["y"],
-                        pen=pg.mkPen(
-                            (
-                                self._series[series]["color"][0],
-                                self._series[series]["color"][1],
-                                self._series[series]["color"][2],
-                            ),
-                            width=1.5,
-                        ),
-                        name=self._series[series].get("label"),
-                    )
-
-                elif self._graphType == "Scatter":
-                    self._graph[series] = pg.ScatterPlotItem(
-                        x=self._series[series]["data"]["x"],
-                        y=self._series[series]["data"]["y"],
-                        pen=pg.mkPen(None),
-                        brush=pg.mkBrush(
-                            self._series[series]["color"][0],
-                            self._series[series]["color"][1],
-                            self._series[series]["color"][2],
-                        ),
-                        size=self._series[series].get("size", 4),
-                        name=self._series[series].get("label", "Undefined Label"),
-                    )
-                    self.plt.addItem(self._graph[series])
-
-                else:
-                    raise Exception("Invalid graph type:", self._graphType)
+            for (i, series) in enumerate(self._series["list"]):
+                self._createPlotItem(i, series)
 
             # Internal layout that contains the graph widget.
             graphLayout = QWidget()
@@ -373,3 +498,12 @@ class Graph(View):
             graphLayout.layout.addWidget(widget)
 
             self._layout = graphLayout
+
+
+# Line pens shared by every graph. Pens for the SERIES_COLOR_SET defaults are
+# built once at import; pens for series that define their own color are added
+# as they are first used.
+_QPEN_BY_SERIES = {
+    name: pg.mkPen(color, width=1.5) for name, color in Graph.SERIES_COLOR_SET.items()
+}
+_QPEN_BY_COLOR = {}
@@ -43,6 +43,12 @@ import sys
 from ArraySimulation.Controller.Console import Console
 from ArraySimulation.Controller.View import View
 from ArraySimulation.Controller.Graph import Graph
+from ArraySimulation.MPPT.MPPTTypes import (
+    GLOBAL_MPPT_TYPES,
+    LOCAL_MPPT_TYPES,
+    STRIDE_TYPES,
+    resolveType,
+)
 
 
 class MPPTView(View):
@@ -312,6 +318,11 @@ class MPPTView(View):
             "AlgorithmStrideSelection"
         ).currentText()
 
+        # Resolve the MPPT algorithm names into their types.
+        MPPTGlobalAlgo = resolveType(MPPTGlobalAlgo, GLOBAL_MPPT_TYPES)
+        MPPTLocalAlgo = resolveType(MPPTLocalAlgo, LOCAL_MPPT_TYPES)
+        MPPTStrideAlgo = resolveType(MPPTStrideAlgo, STRIDE_TYPES)
+
         maxCycle = self._console.getReference("MaxCycleTextbx").text()
         maxCycleRes = self._validate("MaxCycle", maxCycle)
 
@@ -368,17 +379,19 @@ class MPPTView(View):
 
         # Update derived data structures
         VREF = round(
-            cycleResults["mpptOutput"][idx], 2
+            float(cycleResults["mpptOutput"][idx]), 2
         )  # TODO: I don't think we should be doing rounding here. Do it in GlobalMPPT and PVSource instead.
-        IVList = cycleResults["sourceOutput"][idx]["IV"]
+        IVList = controller.getSourceIV(idx)
 
-        MPPTCurrOut = [curr for (volt, curr) in IVList if round(volt, 2) == VREF]
+        # The I-V curve is stored in float32, so match against the closest
+        # voltage instead of testing for equality.
+        MPPTCurrOut = [float(IVList[np.abs(IVList[:, 0] - VREF).argmin(), 1])]
 
         # Percent Yield
         powerStore["actualPower"] = VREF * MPPTCurrOut[0]
         powerStore["theoreticalPower"] = (
-            cycleResults["sourceOutput"][idx]["edge"][2][0]
-            * cycleResults["sourceOutput"][idx]["edge"][2][1]
+            cycleResults["sourceOutput"]["edge"][idx, 2]
+            * cycleResults["sourceOutput"]["edge"][idx, 3]
         )
         percentYield = powerStore["actualPower"] / powerStore["theoreticalPower"]
 
@@ -425,32 +438,32 @@ class MPPTView(View):
         self._datastore["SourceChars"].addPoint(
             "voltage",
             cycleResults["cycle"][idx],
-            cycleResults["sourceOutput"][idx]["edge"][2][0],
+            cycleResults["sourceOutput"]["edge"][idx, 2],
         )
 
         self._datastore["SourceChars"].addPoint(
             "current",
             cycleResults["cycle"][idx],
-            cycleResults["sourceOutput"][idx]["edge"][2][1],
+            cycleResults["sourceOutput"]["edge"][idx, 3],
         )
 
         self._datastore["SourceChars"].addPoint(
             "power",
             cycleResults["cycle"][idx],
-            cycleResults["sourceOutput"][idx]["edge"][2][0]
-            * cycleResults["sourceOutput"][idx]["edge"][2][1],
+            cycleResults["sourceOutput"]["edge"][idx, 2]
+            * cycleResults["sourceOutput"]["edge"][idx, 3],
         )
 
         self._datastore["SourceChars"].addPoint(
             "irradiance",
             cycleResults["cycle"][idx],
-            cycleResults["sourceDef"][idx]["0"]["irradiance"],
+            cycleResults["sourceDef"][idx, 0, 1],
         )
 
         self._datastore["SourceChars"].addPoint(
             "temperature",
             cycleResults["cycle"][idx],
-            cycleResults["sourceDef"][idx]["0"]["temperature"],
+            cycleResults["sourceDef"][idx, 0, 2],
         )
 
     def _plotMPPTCharacteristics(self, MPPTCurrOut):
@@ -488,9 +501,9 @@ class MPPTView(View):
 
         Parameters
         ----------
-        IVList: [(double, double), ..]
-            List of voltage current tuples across the IV Curve for the current
-            source conditions.
+        IVList: ndarray
+            (N, 2) array of voltage current pairs across the IV Curve for the
+            current source conditions.
         VREF: double
             Reference voltage output of the MPPT at the end of the given cycle.
         MPPTCurrOut: [double]
@@ -500,9 +513,9 @@ class MPPTView(View):
         self._datastore["VRefPosition"].clearSeries("voltage")
         self._datastore["VRefPosition"].clearSeries("power")
 
-        voltageList = [entry[0] for entry in IVList]
-        currentList = [entry[1] for entry in IVList]
-        powerList = [entry[0] * entry[1] for entry in IVList]
+        voltageList = IVList[:, 0]
+        currentList = IVList[:, 1]
+        powerList = IVList[:, 0] * IVList[:, 1]
 
         self._datastore["VRefPosition"].addPoints("voltage", voltageList, currentList)
         self._datastore["VRefPosition"].addPoints("power", voltageList, powerList)
@@ -511,8 +524,8 @@ class MPPTView(View):
 
         idx = self.pipelineData["executionIdx"]
         cycleResults = self.pipelineData["cycleResults"]
-        vMax = cycleResults["sourceOutput"][idx]["edge"][2][0]
-        iMax = cycleResults["sourceOutput"][idx]["edge"][2][1]
+        vMax = cycleResults["sourceOutput"]["edge"][idx, 2]
+        iMax = cycleResults["sourceOutput"]["edge"][idx, 3]
         self._datastore["VRefPosition"].addPoints(
             "MPPTVREF",
             [VREF, VREF, vMax, vMax],
@@ -538,8 +551,8 @@ class MPPTView(View):
         self._datastore["PowerComp"].addPoint(
             "power",
             cycleResults["cycle"][idx],
-            cycleResults["sourceOutput"][idx]["edge"][2][0]
-            * cycleResults["sourceOutput"][idx]["edge"][2][1],
+            cycleResults["sourceOutput"]["edge"][idx, 2]
+            * cycleResults["sourceOutput"]["edge"][idx, 3],
         )
 
         self._datastore["PowerComp"].addPoint(
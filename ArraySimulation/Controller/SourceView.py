@@ -325,7 +325,7 @@ class SourceView(View):
                 model,
                 useLookupBool,
             )
-            powers = [voltage * current for voltage, current in zip(voltages, currents)]
+            powers = voltages * currents
 
             # Update the graph.
             self._datastore["Arbitrary"].addSeries(
@@ -461,9 +461,7 @@ class SourceView(View):
                 (voltages, currents) = controller.generateSourceCurve(
                     1, 1000, temp, voltageRes, model, True
                 )
-                powers = [
-                    voltage * current for voltage, current in zip(voltages, currents)
-                ]
+                powers = voltages * currents
 
                 # Update the graph.
                 self._datastore[model]["TempIndependent"].addSeries(
@@ -501,9 +499,7 @@ class SourceView(View):
                 (voltages, currents) = controller.generateSourceCurve(
                     1, irrad, 25, voltageRes, model, True
                 )
-                powers = [
-                    voltage * current for voltage, current in zip(voltages, currents)
-                ]
+                powers = voltages * currents
 
                 # Update the graph.
                 self._datastore[model]["IrradIndependent"].addSeries(
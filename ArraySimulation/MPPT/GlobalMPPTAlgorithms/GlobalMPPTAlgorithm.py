@@ -19,6 +19,14 @@ from ArraySimulation.MPPT.LocalMPPTAlgorithms.FC import FC
 from ArraySimulation.MPPT.LocalMPPTAlgorithms.Ternary import Ternary
 from ArraySimulation.MPPT.LocalMPPTAlgorithms.Golden import Golden
 from ArraySimulation.MPPT.LocalMPPTAlgorithms.Bisection import Bisection
+from ArraySimulation.MPPT.MPPTTypes import (
+    GLOBAL_MPPT_TYPES,
+    LOCAL_MPPT_TYPES,
+    GlobalMPPTType,
+    LocalMPPTType,
+    StrideType,
+    resolveType,
+)
 
 
 class GlobalMPPTAlgorithm:
@@ -39,12 +47,23 @@ class GlobalMPPTAlgorithm:
     # standard conditions.
     MAX_VOLTAGE_PER_CELL = 0.8
 
+    # Local MPPT algorithms that specialize LocalMPPTAlgorithm, keyed by type.
+    # Any other type, including DEFAULT, uses the base class.
+    _LOCAL_MODEL_MAP = {
+        LocalMPPTType.BISECTION: Bisection,
+        LocalMPPTType.FC: FC,
+        LocalMPPTType.GOLDEN: Golden,
+        LocalMPPTType.IC: IC,
+        LocalMPPTType.PANDO: PandO,
+        LocalMPPTType.TERNARY: Ternary,
+    }
+
     def __init__(
         self,
         numCells=1,
-        MPPTGlobalAlgoType="Default",
-        MPPTLocalAlgoType="Default",
-        strideType="Fixed",
+        MPPTGlobalAlgoType=GlobalMPPTType.DEFAULT,
+        MPPTLocalAlgoType=LocalMPPTType.DEFAULT,
+        strideType=StrideType.FIXED,
     ):
         """
         Sets up the initial source parameters.
@@ -54,35 +73,25 @@ class GlobalMPPTAlgorithm:
         numCells: int
             The number of cells that should be accounted for in the MPPT
             algorithm.
-        MPPTGlobalAlgoType: String
-            The name of the global MPPT algorithm type.
-        MPPTLocalAlgoType: String
-            The name of the local MPPT algorithm type.
-        strideType: String
-            The name of the stride algorithm type.
+        MPPTGlobalAlgoType: GlobalMPPTType
+            The global MPPT algorithm type.
+        MPPTLocalAlgoType: LocalMPPTType
+            The local MPPT algorithm type.
+        strideType: StrideType
+            The stride algorithm type.
         TODO: Add stride argument to voltage sweep constructor.
         """
         GlobalMPPTAlgorithm.MAX_VOLTAGE = round(
             GlobalMPPTAlgorithm.MAX_VOLTAGE_PER_CELL * numCells, 2
         )
-        self._MPPTGlobalAlgoType = MPPTGlobalAlgoType
-
-        if MPPTLocalAlgoType == "Bisection":
-            self._model = Bisection(numCells, strideType)
-        elif MPPTLocalAlgoType == "FC":
-            self._model = FC(numCells, strideType)
-        elif MPPTLocalAlgoType == "Golden":
-            self._model = Golden(numCells, strideType)
-        elif MPPTLocalAlgoType == "IC":
-            self._model = IC(numCells, strideType)
-        elif MPPTLocalAlgoType == "PandO":
-            self._model = PandO(numCells, strideType)
-        elif MPPTLocalAlgoType == "Ternary":
-            self._model = Ternary(numCells, strideType)
-        elif MPPTLocalAlgoType == "Default":
-            self._model = MPPTAlgorithm(numCells, MPPTLocalAlgoType, strideType)
+        self._MPPTGlobalAlgoType = resolveType(MPPTGlobalAlgoType, GLOBAL_MPPT_TYPES)
+
+        MPPTLocalAlgoType = resolveType(MPPTLocalAlgoType, LOCAL_MPPT_TYPES)
+        modelClass = GlobalMPPTAlgorithm._LOCAL_MODEL_MAP.get(MPPTLocalAlgoType)
+        if modelClass is not None:
+            self._model = modelClass(numCells, strideType)
         else:
-            self._model = MPPTAlgorithm(numCells, MPPTLocalAlgoType, strideType)
+            self._model = LocalMPPTAlgorithm(numCells, MPPTLocalAlgoType, strideType)
 
         self.vOld = 0.0
         self.iOld = 0.0
@@ -150,7 +159,7 @@ class GlobalMPPTAlgorithm:
 
         Return
         ------
-        String: Model type name.
+        GlobalMPPTType: Model type.
         """
         return self._MPPTGlobalAlgoType
 
@@ -160,7 +169,7 @@ class GlobalMPPTAlgorithm:
 
         Return
         ------
-        String: Model type name.
+        LocalMPPTType: Model type.
         """
         return self._model.getLocalMPPTType()
 
@@ -170,7 +179,7 @@ class GlobalMPPTAlgorithm:
 
         Return
         ------
-        String: Model type name.
+        StrideType: Stride type.
         """
         return self._model.getStrideType()
 
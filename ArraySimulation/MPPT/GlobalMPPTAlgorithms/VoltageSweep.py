@@ -18,6 +18,7 @@ of the P-V curve. It then identifies the global maxima using a LocalMPPTAlgorith
 from ArraySimulation.MPPT.GlobalMPPTAlgorithms.GlobalMPPTAlgorithm import (
     GlobalMPPTAlgorithm,
 )
+from ArraySimulation.MPPT.MPPTTypes import GlobalMPPTType, LocalMPPTType, StrideType
 
 
 class VoltageSweep(GlobalMPPTAlgorithm):
@@ -28,9 +29,14 @@ class VoltageSweep(GlobalMPPTAlgorithm):
     P-V curve. It then identifies the global maxima using a LocalMPPTAlgorithm.
     """
 
-    def __init__(self, numCells=1, MPPTLocalAlgoType="Default", strideType="Fixed"):
+    def __init__(
+        self,
+        numCells=1,
+        MPPTLocalAlgoType=LocalMPPTType.DEFAULT,
+        strideType=StrideType.FIXED,
+    ):
         super(VoltageSweep, self).__init__(
-            numCells, "Voltage Sweep", MPPTLocalAlgoType, strideType
+            numCells, GlobalMPPTType.VOLTAGE_SWEEP, MPPTLocalAlgoType, strideType
         )
 
         # Stores all the voltage values of the local maxima.
@@ -60,6 +60,7 @@ from math import sqrt
 from ArraySimulation.MPPT.LocalMPPTAlgorithms.LocalMPPTAlgorithm import (
     LocalMPPTAlgorithm,
 )
+from ArraySimulation.MPPT.MPPTTypes import LocalMPPTType, StrideType
 
 
 class Bisection(LocalMPPTAlgorithm):
@@ -73,8 +74,8 @@ class Bisection(LocalMPPTAlgorithm):
     # Error tuning parameter.
     error = 0.01
 
-    def __init__(self, numCells=1, strideType="Fixed"):
-        super(Bisection, self).__init__(numCells, "Bisection", strideType)
+    def __init__(self, numCells=1, strideType=StrideType.FIXED):
+        super(Bisection, self).__init__(numCells, LocalMPPTType.BISECTION, strideType)
 
         # Current algorithm internal cycle.
         self.cycle = 0
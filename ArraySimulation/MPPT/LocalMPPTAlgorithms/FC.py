@@ -11,6 +11,7 @@ Description: Implementation of the dP/dV feedback control D&C algorithm.
 from ArraySimulation.MPPT.LocalMPPTAlgorithms.LocalMPPTAlgorithm import (
     LocalMPPTAlgorithm,
 )
+from ArraySimulation.MPPT.MPPTTypes import LocalMPPTType, StrideType
 
 
 class FC(LocalMPPTAlgorithm):
@@ -24,8 +25,8 @@ class FC(LocalMPPTAlgorithm):
     # Error tuning parameter.
     error = 0.05
 
-    def __init__(self, numCells=1, strideType="Fixed"):
-        super(FC, self).__init__(numCells, "FC", strideType)
+    def __init__(self, numCells=1, strideType=StrideType.FIXED):
+        super(FC, self).__init__(numCells, LocalMPPTType.FC, strideType)
 
     def getReferenceVoltage(self, arrVoltage, arrCurrent, irradiance, temperature):
         arrPower = arrCurrent * arrVoltage
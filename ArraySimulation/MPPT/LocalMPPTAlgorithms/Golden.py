@@ -76,6 +76,7 @@ from math import sqrt
 from ArraySimulation.MPPT.LocalMPPTAlgorithms.LocalMPPTAlgorithm import (
     LocalMPPTAlgorithm,
 )
+from ArraySimulation.MPPT.MPPTTypes import LocalMPPTType, StrideType
 
 
 class Golden(LocalMPPTAlgorithm):
@@ -88,8 +89,8 @@ class Golden(LocalMPPTAlgorithm):
 
     phi = (sqrt(5) + 1) / 2 - 1
 
-    def __init__(self, numCells=1, strideType="Fixed"):
-        super(Golden, self).__init__(numCells, "Golden", strideType)
+    def __init__(self, numCells=1, strideType=StrideType.FIXED):
+        super(Golden, self).__init__(numCells, LocalMPPTType.GOLDEN, strideType)
 
         # Current algorithm internal cycle.
         self.cycle = 0
@@ -32,6 +32,7 @@ The implementation of this algorithm is based on the folowing paper:
 from ArraySimulation.MPPT.LocalMPPTAlgorithms.LocalMPPTAlgorithm import (
     LocalMPPTAlgorithm,
 )
+from ArraySimulation.MPPT.MPPTTypes import LocalMPPTType, StrideType
 
 
 class IC(LocalMPPTAlgorithm):
@@ -45,8 +46,8 @@ class IC(LocalMPPTAlgorithm):
     # Error tuning parameter.
     error = 0.01
 
-    def __init__(self, numCells=1, strideType="Fixed"):
-        super(IC, self).__init__(numCells, "IC", strideType)
+    def __init__(self, numCells=1, strideType=StrideType.FIXED):
+        super(IC, self).__init__(numCells, LocalMPPTType.IC, strideType)
 
     def getReferenceVoltage(self, arrVoltage, arrCurrent, irradiance, temperature):
         # Compute secondary values.
@@ -15,6 +15,13 @@ from ArraySimulation.MPPT.MPPTComponents.AdaptiveStride import AdaptiveStride
 from ArraySimulation.MPPT.MPPTComponents.BisectionStride import BisectionStride
 from ArraySimulation.MPPT.MPPTComponents.OptimalStride import OptimalStride
 from ArraySimulation.MPPT.MPPTComponents.Stride import Stride
+from ArraySimulation.MPPT.MPPTTypes import (
+    LOCAL_MPPT_TYPES,
+    STRIDE_TYPES,
+    LocalMPPTType,
+    StrideType,
+    resolveType,
+)
 
 
 class LocalMPPTAlgorithm:
@@ -36,7 +43,20 @@ class LocalMPPTAlgorithm:
     # standard conditions.
     MAX_VOLTAGE_PER_CELL = 0.8
 
-    def __init__(self, numCells=1, MPPTLocalAlgoType="Default", strideType="Fixed"):
+    # Stride models keyed by type.
+    _STRIDE_MODEL_MAP = {
+        StrideType.ADAPTIVE: AdaptiveStride,
+        StrideType.BISECTION: BisectionStride,
+        StrideType.OPTIMAL: OptimalStride,
+        StrideType.FIXED: Stride,
+    }
+
+    def __init__(
+        self,
+        numCells=1,
+        MPPTLocalAlgoType=LocalMPPTType.DEFAULT,
+        strideType=StrideType.FIXED,
+    ):
         """
         Sets up the initial source parameters.
 
@@ -45,26 +65,18 @@ class LocalMPPTAlgorithm:
         numCells: int
             The number of cells that should be accounted for in the MPPT
             algorithm.
-        MPPTLocalAlgoType: String
-            The name of the local MPPT algorithm type.
-        strideType: String
-            The name of the stride algorithm type.
+        MPPTLocalAlgoType: LocalMPPTType
+            The local MPPT algorithm type.
+        strideType: StrideType
+            The stride algorithm type.
         """
         LocalMPPTAlgorithm.MAX_VOLTAGE = (
             numCells * LocalMPPTAlgorithm.MAX_VOLTAGE_PER_CELL
         )
-        self._MPPTLocalAlgoType = MPPTLocalAlgoType
-
-        if strideType == "Adaptive":
-            self._strideModel = AdaptiveStride()
-        elif strideType == "Bisection":
-            self._strideModel = BisectionStride()
-        elif strideType == "Optimal":
-            self._strideModel = OptimalStride()
-        elif strideType == "Fixed":
-            self._strideModel = Stride()
-        else:
-            self._strideModel = Stride()
+        self._MPPTLocalAlgoType = resolveType(MPPTLocalAlgoType, LOCAL_MPPT_TYPES)
+
+        strideType = resolveType(strideType, STRIDE_TYPES)
+        self._strideModel = LocalMPPTAlgorithm._STRIDE_MODEL_MAP[strideType]()
 
         # Previous array voltage value.
         self.vOld = 0.0
@@ -152,7 +164,7 @@ class LocalMPPTAlgorithm:
 
         Return
         ------
-        String: Model type name.
+        LocalMPPTType: Model type.
         """
         return self._MPPTLocalAlgoType
 
@@ -162,6 +174,6 @@ class LocalMPPTAlgorithm:
 
         Return
         ------
-        String: Model type name.
+        StrideType: Stride type.
         """
         return self._strideModel.getStrideType()
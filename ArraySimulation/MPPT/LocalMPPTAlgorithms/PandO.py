@@ -15,6 +15,7 @@ Description: Implementation of the PandO hill climbing algorithm.
 from ArraySimulation.MPPT.LocalMPPTAlgorithms.LocalMPPTAlgorithm import (
     LocalMPPTAlgorithm,
 )
+from ArraySimulation.MPPT.MPPTTypes import LocalMPPTType, StrideType
 
 
 class PandO(LocalMPPTAlgorithm):
@@ -25,8 +26,8 @@ class PandO(LocalMPPTAlgorithm):
     voltage. It belongs to the classification of hill climbing algorithms.
     """
 
-    def __init__(self, numCells=1, strideType="Fixed"):
-        super(PandO, self).__init__(numCells, "PandO", strideType)
+    def __init__(self, numCells=1, strideType=StrideType.FIXED):
+        super(PandO, self).__init__(numCells, LocalMPPTType.PANDO, strideType)
         self._minVoltage = .05
 
     def getReferenceVoltage(self, arrVoltage, arrCurrent, irradiance, temperature):
@@ -45,19 +46,13 @@ class PandO(LocalMPPTAlgorithm):
         if dP > 0:
             if dV > 0:  # Increase vRef.
                 vRef += stride
-                print('Right dp='+str(round(dP, 3))+' dV='+str(round(dV, 3)), end='\t')
             elif dV < 0:  # Decrease vRef.
                 vRef -= stride
-                print('Left dp='+str(round(dP, 3))+' dV='+str(round(dV, 3)), end='\t')
         else:
             if dV > 0:  # Decrease vRef.
                 vRef -= stride
-                print('Left dp='+str(round(dP, 3))+' dV='+str(round(dV, 3)), end='\t')
             elif dV < 0:  # Increase vRef.
                 vRef += stride
-                print('Right dp='+str(round(dP, 3))+' dV='+str(round(dV, 3)), end='\t')
-
-        print(" to ", round(vRef, 3))
 
         # Update dependent values.
         self.vOld = arrVoltage
@@ -56,6 +56,7 @@ from math import sqrt
 from ArraySimulation.MPPT.LocalMPPTAlgorithms.LocalMPPTAlgorithm import (
     LocalMPPTAlgorithm,
 )
+from ArraySimulation.MPPT.MPPTTypes import LocalMPPTType, StrideType
 
 
 class Ternary(LocalMPPTAlgorithm):
@@ -68,8 +69,8 @@ class Ternary(LocalMPPTAlgorithm):
     # Convergence constant.
     q = 0.33  # Roughly the same as dividing by 3.
 
-    def __init__(self, numCells=1, strideType="Fixed"):
-        super(Ternary, self).__init__(numCells, "Ternary", strideType)
+    def __init__(self, numCells=1, strideType=StrideType.FIXED):
+        super(Ternary, self).__init__(numCells, LocalMPPTType.TERNARY, strideType)
 
         # Current algorithm internal cycle.
         self.cycle = 0
@@ -16,6 +16,13 @@ from ArraySimulation.MPPT.GlobalMPPTAlgorithms.GlobalMPPTAlgorithm import (
     GlobalMPPTAlgorithm,
 )
 from ArraySimulation.MPPT.GlobalMPPTAlgorithms.VoltageSweep import VoltageSweep
+from ArraySimulation.MPPT.MPPTTypes import (
+    GLOBAL_MPPT_TYPES,
+    GlobalMPPTType,
+    LocalMPPTType,
+    StrideType,
+    resolveType,
+)
 
 
 class MPPT:
@@ -26,15 +33,21 @@ class MPPT:
     and Local MPPT Algorithms and Stride models (see MPPTComponents) on demand.
     """
 
+    # Global MPPT algorithms that specialize GlobalMPPTAlgorithm, keyed by
+    # type. Any other type, including DEFAULT, uses the base class.
+    _MODEL_MAP = {
+        GlobalMPPTType.VOLTAGE_SWEEP: VoltageSweep,
+    }
+
     def __init__(self):
         self._model = None
 
     def setupModel(
         self,
         numCells=1,
-        MPPTGlobalAlgoType="Default",
-        MPPTLocalAlgoType="Default",
-        strideType="Fixed",
+        MPPTGlobalAlgoType=GlobalMPPTType.DEFAULT,
+        MPPTLocalAlgoType=LocalMPPTType.DEFAULT,
+        strideType=StrideType.FIXED,
     ):
         """
         Initializes an internal model object for reference.
@@ -45,28 +58,35 @@ class MPPT:
         ----------
         numCells: int
             Number of cells expected by the MPPT model.
-        MPPTGlobalAlgoType: String
-            The name of the global MPPT algorithm type.
-        MPPTLocalAlgoType: String
-            The name of the local MPPT algorithm type.
-        strideType: String
-            The name of the stride algorithm type.
+        MPPTGlobalAlgoType: GlobalMPPTType
+            The global MPPT algorithm type.
+        MPPTLocalAlgoType: LocalMPPTType
+            The local MPPT algorithm type.
+        strideType: StrideType
+            The stride algorithm type.
+
+        See MPPTTypes for translating display names into types.
         """
         # Reset any model if there are any already defined.
         if self._model is not None:
             self.reset()
 
-        if MPPTGlobalAlgoType == "Voltage Sweep":
-            self._model = VoltageSweep(numCells, MPPTLocalAlgoType, strideType)
-        elif MPPTGlobalAlgoType == "Default":
-            self._model = GlobalMPPTAlgorithm(
-                numCells, MPPTGlobalAlgoType, MPPTLocalAlgoType, strideType
-            )
+        MPPTGlobalAlgoType = resolveType(MPPTGlobalAlgoType, GLOBAL_MPPT_TYPES)
+        modelClass = MPPT._MODEL_MAP.get(MPPTGlobalAlgoType)
+        if modelClass is not None:
+            self._model = modelClass(numCells, MPPTLocalAlgoType, strideType)
         else:
             self._model = GlobalMPPTAlgorithm(
                 numCells, MPPTGlobalAlgoType, MPPTLocalAlgoType, strideType
             )
 
+        # Bind the model methods directly to skip the wrapper call per cycle.
+        # The wrapper methods below remain for when no model is set up.
+        self.getReferenceVoltage = self._model.getReferenceVoltage
+        self.getGlobalMPPTType = self._model.getGlobalMPPTType
+        self.getLocalMPPTType = self._model.getLocalMPPTType
+        self.getStrideType = self._model.getStrideType
+
     def reset(self):
         """
         Resets the internally set MPPT and its relevant Stride Model.
@@ -85,7 +105,7 @@ class MPPT:
 
         Return
         ------
-        String: Model type name.
+        GlobalMPPTType: Model type.
         """
         return self._model.getGlobalMPPTType()
 
@@ -95,7 +115,7 @@ class MPPT:
 
         Return
         ------
-        String: Model type name.
+        LocalMPPTType: Model type.
         """
         return self._model.getLocalMPPTType()
 
@@ -105,6 +125,6 @@ class MPPT:
 
         Return
         ------
-        String: Stride type name.
+        StrideType: Stride type.
         """
         return self._model.getStrideType()
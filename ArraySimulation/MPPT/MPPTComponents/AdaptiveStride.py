@@ -42,6 +42,7 @@ from math import exp
 
 # Custom Imports.
 from ArraySimulation.MPPT.MPPTComponents.Stride import Stride
+from ArraySimulation.MPPT.MPPTTypes import StrideType
 
 
 class AdaptiveStride(Stride):
@@ -51,7 +52,9 @@ class AdaptiveStride(Stride):
     """
 
     def __init__(self, minStride=0.01, VMPP=0.621, error=0.05):
-        super(AdaptiveStride, self).__init__("Adaptive", minStride, VMPP, error)
+        super(AdaptiveStride, self).__init__(
+            StrideType.ADAPTIVE, minStride, VMPP, error
+        )
 
     def getStride(self, arrVoltage, arrCurrent, irradiance, temperature):
         minStride = self.error * self.error * self.VMPP / (2 * (1 - self.error))
@@ -57,6 +57,7 @@ discussed in the following paper:
 
 # Custom Imports.
 from ArraySimulation.MPPT.MPPTComponents.Stride import Stride
+from ArraySimulation.MPPT.MPPTTypes import StrideType
 
 
 class BisectionStride(Stride):
@@ -76,7 +77,9 @@ class BisectionStride(Stride):
             The multiplier that dictates how large the stride is calculated when
             on the left side of the P-V curve. Empirically determined.
         """
-        super(BisectionStride, self).__init__("Bisection", minStride, VMPP, error)
+        super(BisectionStride, self).__init__(
+            StrideType.BISECTION, minStride, VMPP, error
+        )
 
         # Constant for determining convergence speed on the left side of the VMPP.
         self.slopeMultiplier = slopeMultiplier
@@ -87,14 +90,15 @@ class BisectionStride(Stride):
 
     def getStride(self, arrVoltage, arrCurrent, irradiance, temperature):
         pIn = arrVoltage * arrCurrent
-        dV = arrVoltage - self.vOld
+        vOld = self.vOld
+        dV = arrVoltage - vOld
         dP = pIn - self.pOld
 
         stride = 0
         if abs(dP) >= self._minPowDiff and abs(dV) >= self._minVoltDiff:
             slope = dP / dV
             if slope < 0:
-                stride = (arrVoltage + self.vOld) / 2 - self.vOld
+                stride = (arrVoltage + vOld) / 2 - vOld
             elif slope > 0:
                 stride = slope * self.slopeMultiplier
 
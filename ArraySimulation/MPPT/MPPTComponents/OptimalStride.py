@@ -37,11 +37,14 @@ discussed in the following paper:
 
 # Custom Imports.
 from ArraySimulation.MPPT.MPPTComponents.Stride import Stride
+from ArraySimulation.MPPT.MPPTTypes import StrideType
 
 
 class OptimalStride(Stride):
     def __init__(self, minStride=0.01, VMPP=0.621, error=0.05):
-        super(OptimalStride, self).__init__("Optimal", minStride, VMPP, error)
+        super(OptimalStride, self).__init__(
+            StrideType.OPTIMAL, minStride, VMPP, error
+        )
 
     def getStride(self, arrVoltage, arrCurrent, irradiance, temperature):
         minStride = self.error * self.error * self.VMPP / (2 * (1 - self.error))
@@ -11,6 +11,7 @@ Description: Implementation of the Stride class.
 
 
 # Custom Imports.
+from ArraySimulation.MPPT.MPPTTypes import StrideType
 
 
 class Stride:
@@ -22,14 +23,16 @@ class Stride:
     fixed stride.
     """
 
-    def __init__(self, strideType="Fixed", minStride=0.01, VMPP=0.621, error=0.05):
+    def __init__(
+        self, strideType=StrideType.FIXED, minStride=0.01, VMPP=0.621, error=0.05
+    ):
         """
         Sets up the initial source parameters.
 
         Parameters
         ----------
-        strideType: String
-            The name of the stride type.
+        strideType: StrideType
+            The stride type.
         minStride: float
             The minimum value of the stride, if applicable.
         VMPP: float
@@ -46,12 +49,8 @@ class Stride:
         # The minimum stride attempted in any iteration.
         self._minStride = minStride
 
-        # The previous iteration characteristics.
-        self.vOld = 0.0
-        self.iOld = 0.0
-        self.pOld = 0.0
-        self.irrOld = 0.0
-        self.tOld = 0.0
+        # The previous iteration characteristics. See reset().
+        self.reset()
 
         # The anticipated VMPP to aim for.
         self.VMPP = VMPP
@@ -114,6 +113,10 @@ class Stride:
     def reset(self):
         """
         Resets any internal variables set by the MPPT algorithm during operation.
+
+        The history is kept as plain float attributes rather than packed into
+        an array: derived strides read and write single fields per cycle, and
+        attribute access is far cheaper than indexing into an ndarray.
         """
         self.vOld = 0.0
         self.iOld = 0.0
@@ -127,6 +130,6 @@ class Stride:
 
         Return
         ------
-        String: Stride type name.
+        StrideType: Stride type.
         """
         return self._strideType
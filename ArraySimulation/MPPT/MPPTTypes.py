@@ -0,0 +1,108 @@
+"""
+MPPTTypes.py
+
+Author: agent
+Contact: agent@local
+Created: 10/14/26
+Last Modified: 10/14/26
+
+Description: Integer enumerations of the Global MPPT, Local MPPT, and Stride
+model types. Model types are resolved from their display names once, at the UI
+boundary, and passed through the MPPT as enums from then on. resolveType also
+accepts the display names directly, for callers that still pass them.
+"""
+# Library Imports.
+from enum import IntEnum
+
+
+# Custom Imports.
+
+
+class GlobalMPPTType(IntEnum):
+    """
+    Global MPPT algorithm types.
+    """
+
+    DEFAULT = 0
+    VOLTAGE_SWEEP = 1
+
+
+class LocalMPPTType(IntEnum):
+    """
+    Local MPPT algorithm types.
+    """
+
+    DEFAULT = 0
+    PANDO = 1
+    IC = 2
+    FC = 3
+    TERNARY = 4
+    GOLDEN = 5
+    BISECTION = 6
+
+
+class StrideType(IntEnum):
+    """
+    MPPT stride model types.
+    """
+
+    FIXED = 0
+    ADAPTIVE = 1
+    BISECTION = 2
+    OPTIMAL = 3
+
+
+# Display name to type translations.
+GLOBAL_MPPT_TYPES = {
+    "Default": GlobalMPPTType.DEFAULT,
+    "Voltage Sweep": GlobalMPPTType.VOLTAGE_SWEEP,
+}
+
+LOCAL_MPPT_TYPES = {
+    "Default": LocalMPPTType.DEFAULT,
+    "PandO": LocalMPPTType.PANDO,
+    "IC": LocalMPPTType.IC,
+    "FC": LocalMPPTType.FC,
+    "Ternary": LocalMPPTType.TERNARY,
+    "Golden": LocalMPPTType.GOLDEN,
+    "Bisection": LocalMPPTType.BISECTION,
+}
+
+STRIDE_TYPES = {
+    "Fixed": StrideType.FIXED,
+    "Adaptive": StrideType.ADAPTIVE,
+    "Bisection": StrideType.BISECTION,
+    "Optimal": StrideType.OPTIMAL,
+}
+
+
+def resolveType(value, types):
+    """
+    Resolves a model type from a type, its integer value, or its display name.
+
+    Parameters
+    ----------
+    value: IntEnum, int, or str
+        The model type to resolve.
+    types: dict
+        The display name to type translations of the model type, i.e.
+        GLOBAL_MPPT_TYPES, LOCAL_MPPT_TYPES, or STRIDE_TYPES.
+
+    Return
+    ------
+    IntEnum: The resolved model type.
+
+    Raises
+    ------
+    Exception: If the value does not name a model type.
+    """
+    typeClass = type(next(iter(types.values())))
+    if isinstance(value, str):
+        if value in types:
+            return types[value]
+    else:
+        try:
+            return typeClass(value)
+        except ValueError:
+            pass
+    raise Exception("Invalid " + typeClass.__name__ + ":", value)
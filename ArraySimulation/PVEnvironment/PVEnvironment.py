@@ -337,6 +337,16 @@ class PVEnvironment:
             numCells += self.getModuleNumCells(moduleName)
         return numCells
 
+    def getSourceNumModules(self):
+        """
+        Gets the total number of modules in the array.
+
+        Returns
+        -------
+        int: Number of modules within the entire array.
+        """
+        return len(self._source["pv_model"])
+
     def getModuleEnvironmentDefinition(self, moduleName):
         """
         A stripped down version of getModuleDefinition. Returns just the
@@ -83,6 +83,8 @@ reach any expected output value.
 import csv
 import os
 
+import numpy as np
+
 # Custom Imports.
 
 
@@ -98,6 +100,13 @@ class Lookup:
     # Where all lookup files are located.
     _fileRoot = "./External/"
 
+    # Fixed point scale of the stored outputs. Outputs with at most 3 decimal
+    # places are stored as integer multiples of 1/_SCALE.
+    _SCALE = 1000
+
+    # Entries of the .npz cache of a file; see readFile().
+    _CACHE_KEYS = ("values", "scale", "fileSize", "fileMtime")
+
     def __init__(
         self,
         parameters=[(0.01, 81), (50, 21), (0.5, 161)],
@@ -144,7 +153,15 @@ class Lookup:
         # Name of the csv file containing the lookup table to perform operations on.
         self._filename = fileName
 
-        self.data = []
+        # Buffer of lines to write to the file with writeFile(). Lines read
+        # from the file are parsed into _values instead.
+        self._buffer = []
+
+        # Dependent variables read from the file, as a 2D array with one row
+        # per entry. Independent variables are implied by the row index and are
+        # not kept. Values are stored divided by _scale; see _setTable().
+        self._values = np.empty((0, len(header) - len(parameters)))
+        self._scale = 1
 
     def addLine(self, line):
         """
@@ -158,11 +175,11 @@ class Lookup:
             and is expected to be inserted in order described in the File
             Description.
         """
-        self.data.append(line)
+        self._buffer.append(line)
 
     def lookup(self, params):
         """
-        Searches the internal buffer for the matching indices given by the
+        Searches the internal table for the matching indices given by the
         parameter values. Indexing is interpolated from the values, a line in
         the file corresponding to the indices are found, and a value pops out!
 
@@ -186,32 +203,72 @@ class Lookup:
         More specifically, the number of arguments should match and are in the
         same order.
         """
-        idx = 1  # Start at one to ignore the header entry.
-        paramIndices = []
+        # Bind attributes to locals; this is the scalar hot path of the cell
+        # lookups.
+        parameters = self._parameters
+        multiplier = self._multiplier
+        idx = 0
         for count, param in enumerate(params):
-            paramIdx = int(round(param / self._parameters[count][0]))
-            paramIndices.append(paramIdx)
-            if paramIdx < 0 or paramIdx >= self._parameters[count][1]:
+            resolution, numEntries = parameters[count]
+            paramIdx = int(round(param / resolution))
+            if paramIdx < 0 or paramIdx >= numEntries:
                 raise Exception(
                     "Parameters are out of bounds of the data: "
                     + str(paramIdx)
                     + " for "
                     + str(param)
                     + " with max num entries "
-                    + str(self._parameters[count][1] - 1)
+                    + str(numEntries - 1)
                 )
 
-        multiplier = self._multiplier
-        for count, paramIdx in enumerate(paramIndices):
-            multiplier /= self._parameters[count][1]
+            multiplier //= numEntries
             idx += paramIdx * multiplier
 
-        resultStr = self.data[int(idx)][len(self._parameters) : :]
-        resultFloat = []
-        for result in resultStr:
-            resultFloat.append(float(result))
+        scale = self._scale
+        return [value / scale for value in self._values[idx].tolist()]
+
+    def lookupArray(self, params):
+        """
+        Vectorized version of lookup(). Each independent variable may be an
+        array, and the variables are broadcast against each other; a row is
+        indexed for every resulting combination at once.
+
+        Parameters
+        ----------
+        params: List of floats or ndarrays
+            List of independent variables in column order to search.
+
+        Return
+        ------
+        ndarray: The resultant outputs given the input parameters, of shape
+            (numPoints, numDependentVariables). Points are ordered as the
+            flattened broadcast of the inputs.
+        """
+        params = np.broadcast_arrays(*[np.asarray(param) for param in params])
+
+        idx = 0
+        multiplier = self._multiplier
+        for count, param in enumerate(params):
+            param = param.ravel()
+            resolution, numEntries = self._parameters[count]
+            paramIdx = np.rint(param / resolution).astype(np.int64)
+
+            outOfBounds = np.flatnonzero((paramIdx < 0) | (paramIdx >= numEntries))
+            if outOfBounds.size:
+                first = outOfBounds[0]
+                raise Exception(
+                    "Parameters are out of bounds of the data: "
+                    + str(paramIdx[first])
+                    + " for "
+                    + str(param[first])
+                    + " with max num entries "
+                    + str(numEntries - 1)
+                )
+
+            multiplier //= numEntries
+            idx = idx + paramIdx * multiplier
 
-        return resultFloat
+        return self._values[idx] / self._scale
 
     def writeFile(self):
         """
@@ -220,16 +277,105 @@ class Lookup:
         with open(self._fileRoot + self._filename, "w", newline="\n") as csv_file:
             writer = csv.writer(csv_file)
             writer.writerow(self._header)
-            for line in self.data:
-                writer.writerow(line)
+            writer.writerows(self._buffer)
+
+    def writeArray(self, data):
+        """
+        Writes a 2D array of rows into the file in one pass, bypassing the
+        internal buffer. The array also becomes the internal table, so the file
+        does not need to be read back.
+
+        Parameters
+        ----------
+        data: ndarray
+            Array of shape (numRows, numColumns), with rows in the order
+            described in the File Description.
+        """
+        data = np.asarray(data, dtype=np.float64)
+        self._setTable(data)
+
+        # Floats are written in their shortest round trip form, so that the
+        # file parses back into exactly the table kept in memory.
+        with open(self._fileRoot + self._filename, "w", newline="\n") as csv_file:
+            writer = csv.writer(csv_file)
+            writer.writerow(self._header)
+            writer.writerows(data.tolist())
+        self._writeCache(os.stat(self._fileRoot + self._filename))
 
     def readFile(self):
         """
-        Initializes an internal buffer with the contents of the file, parsed.
-        Repeat calls just repeat the operation.
+        Initializes the internal table with the contents of the file, parsed.
+        Repeat calls just repeat the operation. Lines buffered by addLine() are
+        left as they are.
+
+        The parsed table is cached next to the file in NumPy's .npz format,
+        along with the size and modification time of the file it was parsed
+        from. The cache is used instead of the file for as long as both match.
+        """
+        fileName = self._fileRoot + self._filename
+        cacheName = fileName + ".npz"
+        fileStat = os.stat(fileName)
+
+        if os.path.exists(cacheName):
+            with np.load(cacheName) as cache:
+                if (
+                    all(key in cache for key in Lookup._CACHE_KEYS)
+                    and cache["fileSize"] == fileStat.st_size
+                    and cache["fileMtime"] == fileStat.st_mtime_ns
+                ):
+                    self._values = cache["values"]
+                    self._scale = cache["scale"].item()
+                    return
+
+        self._setTable(np.loadtxt(fileName, delimiter=",", skiprows=1, ndmin=2))
+        self._writeCache(fileStat)
+
+    def _setTable(self, table):
+        """
+        Sets the internal values from a full table of rows.
+
+        Outputs with at most 3 decimal places are stored as int16 (or int32)
+        fixed point values, which is a quarter (or half) the size of float64
+        and divides back into the exact same floats. Other outputs are kept as
+        float64.
+
+        Parameters
+        ----------
+        table: ndarray
+            2D float64 array of rows, including the independent variables.
+        """
+        values = table[:, len(self._parameters) :]
+        scaled = np.rint(values * self._SCALE)
+        if np.array_equal(scaled / self._SCALE, values):
+            for dtype in (np.int16, np.int32):
+                limits = np.iinfo(dtype)
+                if scaled.size == 0 or (
+                    scaled.min() >= limits.min and scaled.max() <= limits.max
+                ):
+                    self._values = scaled.astype(dtype)
+                    self._scale = self._SCALE
+                    return
+
+        self._values = np.ascontiguousarray(values)
+        self._scale = 1
+
+    def _writeCache(self, fileStat):
+        """
+        Saves the internal table next to the file, for readFile() to use.
+
+        Parameters
+        ----------
+        fileStat: os.stat_result
+            Status of the file the table was parsed from or written to.
         """
-        self.data = []
-        with open(self._fileRoot + self._filename, "r", newline="\n") as csv_file:
-            reader = csv.reader(csv_file)
-            for row in reader:
-                self.data.append(row)
+        try:
+            np.savez(
+                self._fileRoot + self._filename + ".npz",
+                values=self._values,
+                scale=self._scale,
+                fileSize=fileStat.st_size,
+                fileMtime=fileStat.st_mtime_ns,
+            )
+        except OSError:
+            # The cache is an optimization; a read only directory is fine.
+            pass
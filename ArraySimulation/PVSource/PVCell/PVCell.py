@@ -99,6 +99,70 @@ class PVCell:
         """
         return self.getCurrent(numCells, voltage, irradiance, temperature)
 
+    def getCurrents(self, numCells=1, voltages=None, irradiance=0.001, temperature=0):
+        """
+        Calculates and returns the cell model current at each voltage of an
+        array, given various environmental parameters.
+
+        This method behaves like a ufunc over voltages: the output has the same
+        shape as the input and its i-th entry is getCurrent() evaluated at the
+        i-th voltage. The base implementation loops over getCurrent(); models
+        that can evaluate their equations over arrays should override it.
+
+        Parameters
+        ----------
+        numCells: int
+            Number of cells in the model.
+        voltages: ndarray
+            Voltages across the cell. Restricted to MAX_VOLTAGE.
+        irradiance: float
+            Irradiance on the cell. In W/M^2.
+        temperature: float
+            Cell surface temperature. In degrees Celsius.
+
+        Returns
+        -------
+        ndarray: float64 currents of the cell model.
+        """
+        voltages = np.asarray(voltages, dtype=np.float64)
+        currents = np.empty(voltages.shape, np.float64)
+        for idx, voltage in np.ndenumerate(voltages):
+            currents[idx] = self.getCurrent(
+                numCells, float(voltage), irradiance, temperature
+            )
+        return currents
+
+    def getCurrentsLookup(
+        self, numCells=1, voltages=None, irradiance=0.001, temperature=0
+    ):
+        """
+        Looks up the cell model current at each voltage of an array, given
+        various environmental parameters. Follows the same contract as
+        getCurrents().
+
+        Parameters
+        ----------
+        numCells: int
+            Number of cells in the model.
+        voltages: ndarray
+            Voltages across the cell. Restricted to MAX_VOLTAGE.
+        irradiance: float
+            Irradiance on the cell. In W/M^2.
+        temperature: float
+            Cell surface temperature. In degrees Celsius.
+
+        Returns
+        -------
+        ndarray: float64 currents of the cell model.
+        """
+        voltages = np.asarray(voltages, dtype=np.float64)
+        currents = np.empty(voltages.shape, np.float64)
+        for idx, voltage in np.ndenumerate(voltages):
+            currents[idx] = self.getCurrentLookup(
+                numCells, float(voltage), irradiance, temperature
+            )
+        return currents
+
     def getCellIV(self, numCells=1, resolution=0.01, irradiance=0.001, temperature=0):
         """
         Calculates the entire cell model current voltage plot given various
@@ -127,29 +191,113 @@ class PVCell:
         -----------
         The IV curve of the cell has a short circuit current of 0A by MAX_VOLTAGE.
         """
-        model = []
         if resolution <= 0:
             resolution = self.MIN_RESOLUTION
 
-        for voltage in np.arange(
+        voltages = np.arange(
             0.0, self.MAX_CELL_VOLTAGE * numCells + resolution, resolution
-        ):
-            current = 0
-            if self._useLookup:
-                current = self.getCurrentLookup(
-                    numCells, voltage, irradiance, temperature
-                )
-            else:
-                current = self.getCurrent(numCells, voltage, irradiance, temperature)
-            if current >= 0.0:
-                model.append(
-                    (round(voltage, 2), round(current, 3))
-                )  # TODO: this rounding should be a function of resolution
-            else:
-                raise Exception("Negative current output from the model: ", current)
+        )
+        if self._useLookup:
+            currents = self.getCurrentsLookup(
+                numCells, voltages, irradiance, temperature
+            )
+        else:
+            currents = self.getCurrents(numCells, voltages, irradiance, temperature)
+
+        self._checkCurrents(currents)
+
+        # TODO: this rounding should be a function of resolution
+        model = list(
+            zip(np.round(voltages, 2).tolist(), np.round(currents, 3).tolist())
+        )
 
         return model
 
+    def getCellIVBatch(
+        self, numCells=1, voltages=None, irradiances=None, temperatures=None
+    ):
+        """
+        Calculates the cell model current voltage plots for every combination of
+        the given irradiances and temperatures at once.
+
+        Parameters
+        ----------
+        numCells: int
+            Number of cells in the model.
+        voltages: ndarray
+            1D array of voltages across the cell. Restricted to MAX_VOLTAGE.
+        irradiances: ndarray
+            1D array of irradiances on the cell. In W/M^2.
+        temperatures: ndarray
+            1D array of cell surface temperatures. In degrees Celsius.
+
+        Returns
+        -------
+        ndarray: float64 array of shape (len(irradiances), len(temperatures),
+            len(voltages), 2). Entry [g, t, v] is the (voltage, current) pair
+            of the cell IV curve at irradiances[g] and temperatures[t]. Unlike
+            getCellIV(), values are not rounded.
+        Throws an exception for undefined cell models or negative current
+            outputs.
+        """
+        voltages = np.asarray(voltages, dtype=np.float64).ravel()
+        irradiances = np.asarray(irradiances, dtype=np.float64).ravel()
+        temperatures = np.asarray(temperatures, dtype=np.float64).ravel()
+
+        currents = self._getCurrentsBatch(numCells, voltages, irradiances, temperatures)
+        self._checkCurrents(currents)
+
+        model = np.empty(currents.shape + (2,), np.float64)
+        model[..., 0] = voltages
+        model[..., 1] = currents
+        return model
+
+    def _getCurrentsBatch(self, numCells, voltages, irradiances, temperatures):
+        """
+        Calculates the cell model currents for getCellIVBatch(). The base
+        implementation calls getCurrents() or getCurrentsLookup() once per
+        condition; models that can solve the whole sweep at once should
+        override it.
+
+        Parameters
+        ----------
+        numCells: int
+            Number of cells in the model.
+        voltages, irradiances, temperatures: ndarray
+            1D float64 arrays of the conditions to sweep. See getCellIVBatch().
+
+        Returns
+        -------
+        ndarray: float64 currents of shape (len(irradiances), len(temperatures),
+            len(voltages)).
+        """
+        currents = np.empty(
+            (len(irradiances), len(temperatures), len(voltages)), np.float64
+        )
+        getCurrents = self.getCurrentsLookup if self._useLookup else self.getCurrents
+        for gIdx, irradiance in enumerate(irradiances.tolist()):
+            for tIdx, temperature in enumerate(temperatures.tolist()):
+                currents[gIdx, tIdx] = getCurrents(
+                    numCells, voltages, irradiance, temperature
+                )
+        return currents
+
+    def _checkCurrents(self, currents):
+        """
+        Raises an exception if the model output any negative currents.
+
+        Parameters
+        ----------
+        currents: ndarray
+            Currents output by the model.
+        """
+        negative = np.flatnonzero(currents < 0.0)
+        if negative.size:
+            raise Exception(
+                "Negative current output from the model: ",
+                currents.flat[negative[0]].item(),
+            )
+
     def getCellEdgeCharacteristics(
         self, numCells=1, resolution=0.001, irradiance=0.001, temperature=0
     ):
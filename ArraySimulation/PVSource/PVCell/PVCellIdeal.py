@@ -10,11 +10,11 @@ Description: Derived class of PVCell that implements an ideal model tuned to
 the Sunpower Maxeon III Bin Le1 solar cells.
 """
 # Library Imports.
-from math import exp, pow, e
-from numpy import log as ln
+
 
 # Custom Imports.
 from ArraySimulation.PVSource.PVCell.PVCell import PVCell
+from ArraySimulation.PVSource.PVCell.PVCellKernels import idealCurrent
 
 
 class PVCellIdeal(PVCell):
@@ -30,52 +30,18 @@ class PVCellIdeal(PVCell):
         # TODO: numCells here may be abused and should be revised.
 
         # Ideal single diode model.
-        cellTemperature = temperature + 273.15  # Convert cell temperature into kelvin.
-
-        # Suppres divide by 0s from voltage and irradiance.
-        if voltage == 0.0:
-            voltage = 0.001
-        if irradiance == 0.0:
-            irradiance = 0.001
-
-        # Short circuit current.
-        SCCurrent = (
-            irradiance
-            / self.refIrrad
-            * self.refSCCurrent
-            * (1 + 6e-4 * (cellTemperature - self.refTemp))
+        return idealCurrent(
+            int(numCells),
+            float(voltage),
+            float(irradiance),
+            float(temperature),
+            self.refIrrad,
+            self.refSCCurrent,
+            self.refOCVoltage,
+            self.refTemp,
+            self.k,
+            self.q,
         )
 
-        # Open circuit voltage.
-        OCVoltage = (
-            self.refOCVoltage
-            - 2.2e-3 * (cellTemperature - self.refTemp)
-            + numCells
-            * self.k
-            * cellTemperature
-            / self.q
-            * ln(irradiance / self.refIrrad)
-        )
-
-        # Photovoltatic current.
-        PVCurrent = SCCurrent
-
-        # Reverse saturation current, or dark saturation current.
-        revSatCurrent = exp(
-            ln(SCCurrent) - self.q * OCVoltage / (self.k * cellTemperature)
-        )
-
-        # Diode current.
-        diodeCurrent = PVCurrent
-        if voltage <= numCells * OCVoltage:
-            diodeCurrent = revSatCurrent * (
-                exp(self.q * voltage / (numCells * self.k * cellTemperature)) - 1
-            )
-
-        # Output current.
-        current = PVCurrent - diodeCurrent
-
-        return current
-
     def getModelType(self):
         return "Ideal"
@@ -0,0 +1,436 @@
+"""
+PVCellKernels.py
+
+Author: agent
+Contact: agent@local
+Created: 10/14/26
+Last Modified: 10/14/26
+
+Description: Compiled numeric kernels for the PVCell models. The cell equations
+are written as free functions over scalar arguments so that Numba can compile
+them to native code. Physical constants are passed in as arguments rather than
+read off of the cell objects.
+
+If Numba is not installed, the kernels run as regular Python functions and give
+the same results, only slower.
+
+The kernels are compiled lazily, on their first call, and cached to disk
+(cache=True). The first run after a change to this file spends a second or two
+compiling; later runs load the cached machine code from __pycache__ in a
+fraction of that. If __pycache__ is not writable, point the NUMBA_CACHE_DIR
+environment variable at a directory that is. Setting NUMBA_DISABLE_JIT=1 skips
+compilation altogether and runs the kernels as Python.
+"""
+# Library Imports.
+from math import exp, log
+import numpy as np
+
+try:
+    from numba import njit, prange
+
+    # Whether the kernels are compiled. Callers with a vectorized NumPy
+    # alternative should prefer it when they are not.
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - exercised only without numba.
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """
+        Stand in for numba.njit that returns the function uncompiled. Supports
+        both the bare @njit and the @njit(...) forms.
+        """
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda function: function
+
+    prange = range
+
+# Custom Imports.
+
+
+# Fast math flags for kernels that must detect overflow. Unlike fastmath=True,
+# these leave out "nnan" and "ninf", under which LLVM may assume values are
+# finite and fold away checks such as np.isfinite().
+FINITE_FASTMATH = {"contract", "afn", "reassoc", "nsz", "arcp"}
+
+# Constants for the range reduction in fastExp().
+LN2 = 0.6931471805599453
+LOG2E = 1.4426950408889634
+
+
+@njit(cache=True, fastmath=True, inline="always")
+def fastExp(x):
+    """
+    Approximates exp(x) with a range reduction around powers of two and a
+    degree 6 minimax polynomial. The polynomial was fit with the Remez exchange
+    algorithm to minimize the relative error of e^r over |r| <= ln(2) / 2,
+    where it is within 1.9e-9. This is well below the accuracy of the cell
+    model, for a handful of multiply-adds.
+
+    Parameters
+    ----------
+    x: float
+        Exponent. Expected to be well within the float64 range; the diode
+        exponent of the Nonideal model stays roughly within [0, 45].
+
+    Returns
+    -------
+    float: approximation of e^x.
+    """
+    # x = n * ln(2) + r, with |r| <= ln(2) / 2.
+    n = np.floor(x * LOG2E + 0.5)
+    r = x - n * LN2
+
+    # Minimax polynomial of e^r, in Horner form.
+    poly = 1.0000000005541663 + r * (
+        1.0000000363231993
+        + r
+        * (
+            0.49999992079817407
+            + r
+            * (
+                0.1666642016984536
+                + r
+                * (
+                    0.041668225569336796
+                    + r * (0.008374815804581617 + r * 0.001383684600111529)
+                )
+            )
+        )
+    )
+    return poly * 2.0**n
+
+
+@njit(cache=True, fastmath=True)
+def idealCurrent(
+    numCells,
+    voltage,
+    irradiance,
+    temperature,
+    refIrrad,
+    refSCCurrent,
+    refOCVoltage,
+    refTemp,
+    k,
+    q,
+):
+    """
+    Calculates the current of the ideal single diode model. See
+    PVCellIdeal.getCurrent().
+
+    Parameters
+    ----------
+    numCells: int
+        Number of cells in the model.
+    voltage: float
+        Voltage across the cell.
+    irradiance: float
+        Irradiance on the cell. In W/M^2.
+    temperature: float
+        Cell surface temperature. In degrees Celsius.
+    refIrrad, refSCCurrent, refOCVoltage, refTemp, k, q: float
+        Reference values and physical constants of the model. See PVCell.
+
+    Returns
+    -------
+    float: current of the cell model.
+    """
+    cellTemperature = temperature + 273.15  # Convert cell temperature into kelvin.
+
+    # Suppres divide by 0s from voltage and irradiance. Written as conditional
+    # expressions so they compile to selects rather than branches.
+    voltage = voltage if voltage != 0.0 else 0.001
+    irradiance = irradiance if irradiance != 0.0 else 0.001
+
+    # Short circuit current.
+    SCCurrent = (
+        irradiance
+        / refIrrad
+        * refSCCurrent
+        * (1 + 6e-4 * (cellTemperature - refTemp))
+    )
+
+    # Thermal voltage terms shared by the equations below.
+    thermalVoltage = k * cellTemperature / q
+    qOverKT = 1 / thermalVoltage
+
+    # Open circuit voltage.
+    OCVoltage = (
+        refOCVoltage
+        - 2.2e-3 * (cellTemperature - refTemp)
+        + numCells * thermalVoltage * log(irradiance / refIrrad)
+    )
+
+    # Photovoltatic current.
+    PVCurrent = SCCurrent
+
+    # Reverse saturation current, or dark saturation current.
+    revSatCurrent = SCCurrent * exp(-qOverKT * OCVoltage)
+
+    # Diode current.
+    diodeCurrent = PVCurrent
+    if voltage <= numCells * OCVoltage:
+        diodeCurrent = revSatCurrent * (exp(qOverKT * voltage / numCells) - 1)
+
+    # Output current.
+    return PVCurrent - diodeCurrent
+
+
+@njit(cache=True, fastmath=FINITE_FASTMATH)
+def nonidealCurrent(
+    voltage,
+    irradiance,
+    temperature,
+    refIrrad,
+    refSCCurrent,
+    refOCVoltage,
+    refTemp,
+    k,
+    q,
+    rSeries,
+    rShunt,
+    useFastExp=False,
+):
+    """
+    Solves the nonideal single diode model for the cell current with Newton's
+    method. See PVCellNonideal.getCurrent().
+
+    Parameters
+    ----------
+    voltage: float
+        Voltage across the cell.
+    irradiance: float
+        Irradiance on the cell. In W/M^2.
+    temperature: float
+        Cell surface temperature. In degrees Celsius.
+    refIrrad, refSCCurrent, refOCVoltage, refTemp, k, q: float
+        Reference values and physical constants of the model. See PVCell.
+    rSeries, rShunt: float
+        Series and shunt resistance of the cell. In Ohms.
+    useFastExp: bool
+        Whether Newton's method uses fastExp() in place of math.exp(). The
+        bisection fallback always uses math.exp().
+
+    Returns
+    -------
+    float: current of the cell model, clamped to 0A past open circuit.
+    """
+    # The model is undefined in the dark, so floor the irradiance as
+    # PVCellNonideal._solveCurrents() does.
+    irradiance = max(irradiance, 0.001)
+    cellTemperature = temperature + 273.15  # Convert cell temperature into kelvin.
+
+    # Short circuit current.
+    SCCurrent = (
+        irradiance
+        / refIrrad
+        * refSCCurrent
+        * (1 + 6e-4 * (cellTemperature - refTemp))
+    )
+
+    # Open circuit voltage.
+    OCVoltage = (
+        refOCVoltage
+        - 2.2e-3 * (cellTemperature - refTemp)
+        + k * cellTemperature / q * log(irradiance / refIrrad)
+    )
+
+    # Photovoltatic current.
+    PVCurrent = SCCurrent
+
+    # Reverse saturation current, or dark saturation current.
+    revSatCurrent = exp(log(SCCurrent) - q * OCVoltage / (k * cellTemperature))
+
+    # Iteratively solve for the implicit parameter with Newton's method on
+    # the residual f(I) = I - (PVCurrent - diodeCurrent(I)). The exponent
+    # is shared between the residual and its derivative.
+    thermalFactor = q / (k * cellTemperature)
+
+    # Start from the line between short circuit and open circuit, which is
+    # close to the curve below the knee and exact at 0V.
+    currentPrediction = max(0.0, SCCurrent * (1.0 - voltage / OCVoltage))
+    lastResidual = np.inf
+    converged = False
+    for iteration in range(20):
+        junctionVoltage = voltage + currentPrediction * rSeries
+        if useFastExp:
+            expTerm = fastExp(thermalFactor * junctionVoltage)
+        else:
+            expTerm = exp(thermalFactor * junctionVoltage)
+
+        # Diode current.
+        diodeCurrent = revSatCurrent * (expTerm - 1) - junctionVoltage / rShunt
+        residual = currentPrediction - (PVCurrent - diodeCurrent)
+
+        # The residual is convex and increasing, so after the first step the
+        # iterates approach the root from above and the residual shrinks. If
+        # it grows instead, Newton is diverging.
+        if iteration > 1 and abs(residual) > lastResidual:
+            break
+        lastResidual = abs(residual)
+
+        slope = 1 + revSatCurrent * thermalFactor * rSeries * expTerm - rSeries / rShunt
+        delta = residual / slope
+        currentPrediction -= delta
+        if abs(delta) < 1e-10 * max(currentPrediction, 1e-3):
+            converged = True
+            break
+
+    if not converged or not np.isfinite(currentPrediction):
+        currentPrediction = _bisectCurrent(
+            voltage, PVCurrent, revSatCurrent, thermalFactor, rSeries, rShunt
+        )
+
+    # Past open circuit the model solves for a negative current; the cell
+    # does not sink current, so clamp it.
+    return max(currentPrediction, 0.0)
+
+
+@njit(cache=True, fastmath=FINITE_FASTMATH)
+def _bisectCurrent(voltage, PVCurrent, revSatCurrent, thermalFactor, rSeries, rShunt):
+    """
+    Fallback for nonidealCurrent() when Newton's method fails to converge. Slow
+    but guaranteed to converge.
+
+    Parameters
+    ----------
+    voltage: float
+        Voltage across the cell.
+    PVCurrent, revSatCurrent, thermalFactor: float
+        Terms of the diode equation, as computed in nonidealCurrent().
+    rSeries, rShunt: float
+        Series and shunt resistance of the cell. In Ohms.
+
+    Returns
+    -------
+    float: current of the cell model, or 0A if the root is not positive.
+    """
+    # The residual is increasing in the current. At the upper bound the linear
+    # terms cancel and the diode term is non-negative, so the root is bracketed
+    # by [0, upper] whenever it is positive.
+    lower = 0.0
+    upper = (PVCurrent + voltage / rShunt) / (1 - rSeries / rShunt)
+    residual = (
+        revSatCurrent * (exp(thermalFactor * voltage) - 1) - voltage / rShunt
+    ) - PVCurrent
+    if residual >= 0.0:
+        return 0.0
+
+    for _ in range(64):
+        current = 0.5 * (lower + upper)
+        junctionVoltage = voltage + current * rSeries
+        diodeCurrent = (
+            revSatCurrent * (exp(thermalFactor * junctionVoltage) - 1)
+            - junctionVoltage / rShunt
+        )
+        if current - (PVCurrent - diodeCurrent) < 0.0:
+            lower = current
+        else:
+            upper = current
+    return 0.5 * (lower + upper)
+
+
+@njit(cache=True, parallel=True)
+def nonidealCurrents(
+    voltages,
+    irradiance,
+    temperature,
+    refIrrad,
+    refSCCurrent,
+    refOCVoltage,
+    refTemp,
+    k,
+    q,
+    rSeries,
+    rShunt,
+    useFastExp=False,
+):
+    """
+    Evaluates nonidealCurrent() over an array of voltages, spreading the
+    voltages across cores.
+
+    Parameters
+    ----------
+    voltages: ndarray
+        1D float64 array of voltages across the cell.
+    All other parameters are as in nonidealCurrent().
+
+    Returns
+    -------
+    ndarray: float64 currents of the cell model, one per voltage.
+    """
+    currents = np.empty(voltages.shape[0], np.float64)
+    for idx in prange(voltages.shape[0]):
+        currents[idx] = nonidealCurrent(
+            voltages[idx],
+            irradiance,
+            temperature,
+            refIrrad,
+            refSCCurrent,
+            refOCVoltage,
+            refTemp,
+            k,
+            q,
+            rSeries,
+            rShunt,
+            useFastExp,
+        )
+    return currents
+
+
+@njit(cache=True, parallel=True)
+def nonidealCurrentGrid(
+    voltages,
+    irradiances,
+    temperatures,
+    refIrrad,
+    refSCCurrent,
+    refOCVoltage,
+    refTemp,
+    k,
+    q,
+    rSeries,
+    rShunt,
+    useFastExp=False,
+):
+    """
+    Evaluates nonidealCurrent() over every combination of the given voltages,
+    irradiances, and temperatures. The grid points are independent, so the
+    voltage axis is spread across cores.
+
+    Parameters
+    ----------
+    voltages: ndarray
+        1D float64 array of voltages across the cell.
+    irradiances: ndarray
+        1D float64 array of irradiances on the cell. In W/M^2.
+    temperatures: ndarray
+        1D float64 array of cell surface temperatures. In degrees Celsius.
+    All other parameters are as in nonidealCurrent().
+
+    Returns
+    -------
+    ndarray: float64 currents of the cell model, of shape (len(voltages),
+        len(irradiances), len(temperatures)).
+    """
+    currents = np.empty(
+        (voltages.shape[0], irradiances.shape[0], temperatures.shape[0]), np.float64
+    )
+    for vIdx in prange(voltages.shape[0]):
+        for gIdx in range(irradiances.shape[0]):
+            for tIdx in range(temperatures.shape[0]):
+                currents[vIdx, gIdx, tIdx] = nonidealCurrent(
+                    voltages[vIdx],
+                    irradiances[gIdx],
+                    temperatures[tIdx],
+                    refIrrad,
+                    refSCCurrent,
+                    refOCVoltage,
+                    refTemp,
+                    k,
+                    q,
+                    rSeries,
+                    rShunt,
+                    useFastExp,
+                )
+    return currents
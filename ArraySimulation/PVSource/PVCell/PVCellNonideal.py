@@ -12,14 +12,18 @@ the Sunpower Maxeon III Bin Le1 solar cells.
 TODO: Implement number of cells in output.
 """
 # Library Imports.
-from math import exp, pow, e
-from numpy import log as ln
 import numpy as np
 
 
 # Custom Imports.
 from ArraySimulation.PVSource.PVCell.PVCell import PVCell
 from ArraySimulation.PVSource.PVCell.Lookup import Lookup
+from ArraySimulation.PVSource.PVCell.PVCellKernels import (
+    NUMBA_AVAILABLE,
+    nonidealCurrent,
+    nonidealCurrentGrid,
+    nonidealCurrents,
+)
 
 
 class PVCellNonideal(PVCell):
@@ -28,9 +32,14 @@ class PVCellNonideal(PVCell):
     Maxeon III Bin Le1 solar cells.
     """
 
-    def __init__(self, useLookup=True):
+    def __init__(self, useLookup=True, useFastExp=False):
         super(PVCellNonideal, self).__init__(useLookup)
 
+        # Controls whether the compiled solver approximates the diode exp()
+        # with fastExp(). Currents move by under 1e-8A. The NumPy solver used
+        # without Numba always uses np.exp().
+        self.useFastExp = useFastExp
+
         # Lookup object built from the provided file name sourced from
         # /External.
         self._lookup = Lookup(fileName="NonidealCellLookup.csv")
@@ -40,77 +49,199 @@ class PVCellNonideal(PVCell):
         # TODO: numCells here may be abused and should be revised.
 
         # Nonideal single diode model.
-        cellTemperature = temperature + 273.15  # Convert cell temperature into kelvin.
+        return nonidealCurrent(
+            float(voltage),
+            float(irradiance),
+            float(temperature),
+            PVCell.refIrrad,
+            PVCell.refSCCurrent,
+            PVCell.refOCVoltage,
+            PVCell.refTemp,
+            PVCell.k,
+            PVCell.q,
+            self.rSeries,
+            self.rShunt,
+            self.useFastExp,
+        )
+
+    def getCurrents(self, numCells=1, voltages=None, irradiance=0.001, temperature=0):
+        # Solve the voltages in bulk instead of one getCurrent() call each.
+        voltages = np.asarray(voltages, dtype=np.float64)
+        if not NUMBA_AVAILABLE:
+            return self._solveCurrents(voltages, irradiance, temperature)
+
+        currents = nonidealCurrents(
+            np.ascontiguousarray(voltages.ravel()),
+            float(irradiance),
+            float(temperature),
+            PVCell.refIrrad,
+            PVCell.refSCCurrent,
+            PVCell.refOCVoltage,
+            PVCell.refTemp,
+            PVCell.k,
+            PVCell.q,
+            self.rSeries,
+            self.rShunt,
+            self.useFastExp,
+        )
+        return currents.reshape(voltages.shape)
+
+    def _solveCurrents(self, voltage, irradiance, temperature, iterations=20):
+        """
+        Solves the model for the cell current over arrays of environmental
+        parameters at once, using Newton's method on the implicit single
+        diode equation solved by getCurrent().
+
+        Parameters
+        ----------
+        voltage: ndarray
+            Voltages across the cell.
+        irradiance: ndarray
+            Irradiances on the cell. In W/M^2. Floored at 0.001 W/M^2, since
+            the model is undefined in the dark.
+        temperature: ndarray
+            Cell surface temperatures. In degrees Celsius.
+        iterations: int
+            Maximum number of Newton iterations to run. The residual is convex
+            and increasing in the current, so iterations converge monotonically
+            once past the root. Points that have not converged to the same
+            relative tolerance as nonidealCurrent() by then are solved by
+            bisection instead.
+
+        Returns
+        -------
+        ndarray: float64 currents of the cell model, broadcast over the
+            inputs. Negative currents past open circuit are clamped to 0A.
+        """
+        irradiance = np.maximum(irradiance, 0.001)
+        cellTemperature = np.add(temperature, 273.15)
+        thermalVoltage = PVCell.k * cellTemperature / PVCell.q
 
-        # Short circuit current.
         SCCurrent = (
             irradiance
             / PVCell.refIrrad
             * PVCell.refSCCurrent
             * (1 + 6e-4 * (cellTemperature - PVCell.refTemp))
         )
-
-        # Open circuit voltage.
         OCVoltage = (
             PVCell.refOCVoltage
             - 2.2e-3 * (cellTemperature - PVCell.refTemp)
-            + PVCell.k * cellTemperature / PVCell.q * ln(irradiance / PVCell.refIrrad)
+            + thermalVoltage * np.log(irradiance / PVCell.refIrrad)
         )
-
-        # Photovoltatic current.
         PVCurrent = SCCurrent
+        revSatCurrent = np.exp(np.log(SCCurrent) - OCVoltage / thermalVoltage)
 
-        # Reverse saturation current, or dark saturation current.
-        revSatCurrent = exp(
-            ln(SCCurrent) - PVCell.q * OCVoltage / (PVCell.k * cellTemperature)
-        )
+        # Residual f(I) = I - (PVCurrent - diodeCurrent(I)), where
+        # diodeCurrent(I) = revSat * (exp((V + I*rS)/Vt) - 1) - (V + I*rS)/rSh.
+        rSeries = self.rSeries
+        rShunt = self.rShunt
 
-        # Iteratively solve for the implicit parameter.
-        currentPrediction = 0
-        left = currentPrediction
-
-        # Diode current.
-        diodeCurrent = (
-            revSatCurrent
-            * (
-                exp(
-                    PVCell.q
-                    * (voltage + currentPrediction * self.rSeries)
-                    / (PVCell.k * cellTemperature)
-                )
-                - 1
+        # Loop invariant parts of the residual slope.
+        slopeScale = revSatCurrent * rSeries / thermalVoltage
+        slopeOffset = 1 - rSeries / rShunt
+
+        # Each iteration is evaluated in place with ufunc out= buffers, so no
+        # temporaries are allocated inside the loop. Start from the same
+        # guess as nonidealCurrent().
+        shape = np.broadcast(voltage, SCCurrent).shape
+        current = np.empty(shape)
+        current[...] = np.maximum(SCCurrent * (1.0 - voltage / OCVoltage), 0.0)
+        junctionVoltage = np.empty(shape)
+        expTerm = np.empty(shape)
+        residual = np.empty(shape)
+        tolerance = np.empty(shape)
+        converged = np.zeros(shape, dtype=bool)
+
+        # Overflowing points are caught by the bisection fallback below.
+        with np.errstate(over="ignore", invalid="ignore"):
+            for _ in range(iterations):
+                np.multiply(current, rSeries, out=junctionVoltage)
+                junctionVoltage += voltage
+                np.divide(junctionVoltage, thermalVoltage, out=expTerm)
+                np.exp(expTerm, out=expTerm)
+
+                # residual = I - PVCurrent + revSat * (exp - 1) - junction / rSh
+                np.subtract(expTerm, 1, out=residual)
+                residual *= revSatCurrent
+                residual += current
+                residual -= PVCurrent
+                junctionVoltage /= rShunt
+                residual -= junctionVoltage
+
+                # slope = 1 + revSat * rS / Vt * exp - rS / rSh, reusing the exp
+                # buffer.
+                expTerm *= slopeScale
+                expTerm += slopeOffset
+                residual /= expTerm
+                current -= residual
+
+                # Converged once every step is within the relative tolerance.
+                np.maximum(current, 1e-3, out=tolerance)
+                tolerance *= 1e-10
+                np.abs(residual, out=residual)
+                np.less(residual, tolerance, out=converged)
+                if converged.all():
+                    break
+
+        # Newton's method only converges monotonically once past the root. Any
+        # points that did not converge, or overflowed, are bisected instead.
+        unsolved = ~(converged & np.isfinite(current))
+        if unsolved.any():
+            current[unsolved] = self._bisectCurrents(
+                np.broadcast_to(voltage, shape)[unsolved],
+                np.broadcast_to(PVCurrent, shape)[unsolved],
+                np.broadcast_to(revSatCurrent, shape)[unsolved],
+                np.broadcast_to(thermalVoltage, shape)[unsolved],
             )
-            - (voltage + currentPrediction * self.rSeries) / self.rShunt
-        )
-        right = PVCurrent - diodeCurrent
-
-        difference = (left - right) ** 2
-        decreasing = True
-
-        while decreasing:
-            currentPrediction += 0.001
-            left = currentPrediction
-
-            diodeCurrent = (
-                revSatCurrent
-                * (
-                    exp(
-                        PVCell.q
-                        * (voltage + currentPrediction * self.rSeries)
-                        / (PVCell.k * cellTemperature)
-                    )
-                    - 1
-                )
-                - (voltage + currentPrediction * self.rSeries) / self.rShunt
+
+        return np.maximum(current, 0.0)
+
+    def _bisectCurrents(self, voltage, PVCurrent, revSatCurrent, thermalVoltage):
+        """
+        Solves the model for the cell current by bisection, as the fallback of
+        _solveCurrents(). Slow but guaranteed to converge. Mirrors
+        PVCellKernels._bisectCurrent().
+
+        Parameters
+        ----------
+        voltage: ndarray
+            1D array of voltages across the cell.
+        PVCurrent, revSatCurrent, thermalVoltage: ndarray
+            1D arrays of the terms of the diode equation, as computed in
+            _solveCurrents().
+
+        Returns
+        -------
+        ndarray: float64 currents of the cell model, or 0A where the root is
+            not positive.
+        """
+        rSeries = self.rSeries
+        rShunt = self.rShunt
+
+        def residual(current):
+            junctionVoltage = voltage + current * rSeries
+            return (
+                current
+                - PVCurrent
+                + revSatCurrent * np.expm1(junctionVoltage / thermalVoltage)
+                - junctionVoltage / rShunt
             )
-            right = PVCurrent - diodeCurrent
 
-            # If my difference change has flipped signs, I'm done.
-            if (difference - (left - right) ** 2) <= 0.0:
-                decreasing = False
-            difference = (left - right) ** 2
+        # The residual is increasing in the current. At the upper bound the
+        # linear terms cancel and the diode term is non-negative, so the root
+        # is bracketed by [0, upper] whenever it is positive.
+        lower = np.zeros(voltage.shape)
+        upper = (PVCurrent + voltage / rShunt) / (1 - rSeries / rShunt)
+        solvable = residual(lower) < 0.0
+
+        with np.errstate(over="ignore"):
+            for _ in range(64):
+                current = 0.5 * (lower + upper)
+                below = residual(current) < 0.0
+                lower = np.where(below, current, lower)
+                upper = np.where(below, upper, current)
 
-        return currentPrediction
+        return np.where(solvable, 0.5 * (lower + upper), 0.0)
 
     def getCurrentLookup(self, numCells=1, voltage=0, irradiance=0.001, temperature=0):
         """
@@ -121,6 +252,52 @@ class PVCellNonideal(PVCell):
         """
         return self._lookup.lookup([voltage, irradiance, temperature])[0]
 
+    def getCurrentsLookup(
+        self, numCells=1, voltages=None, irradiance=0.001, temperature=0
+    ):
+        # Index the table for every voltage at once.
+        voltages = np.asarray(voltages, dtype=np.float64)
+        currents = self._lookup.lookupArray([voltages, irradiance, temperature])
+        return currents[:, 0].reshape(voltages.shape)
+
+    def _getCurrentsBatch(self, numCells, voltages, irradiances, temperatures):
+        # Solve or index the whole sweep in one call.
+        if self._useLookup:
+            currents = self._lookup.lookupArray(
+                [
+                    voltages[np.newaxis, np.newaxis, :],
+                    irradiances[:, np.newaxis, np.newaxis],
+                    temperatures[np.newaxis, :, np.newaxis],
+                ]
+            )
+            return currents[:, 0].reshape(
+                (len(irradiances), len(temperatures), len(voltages))
+            )
+
+        if NUMBA_AVAILABLE:
+            currents = nonidealCurrentGrid(
+                voltages,
+                irradiances,
+                temperatures,
+                PVCell.refIrrad,
+                PVCell.refSCCurrent,
+                PVCell.refOCVoltage,
+                PVCell.refTemp,
+                PVCell.k,
+                PVCell.q,
+                self.rSeries,
+                self.rShunt,
+                self.useFastExp,
+            )
+            # The grid kernel is indexed (voltage, irradiance, temperature).
+            return currents.transpose(1, 2, 0)
+
+        return self._solveCurrents(
+            voltages[np.newaxis, np.newaxis, :],
+            irradiances[:, np.newaxis, np.newaxis],
+            temperatures[np.newaxis, :, np.newaxis],
+        )
+
     def buildCurrentLookup(
         self,
         fileName="NonidealCellLookup2.csv",
@@ -130,8 +307,8 @@ class PVCellNonideal(PVCell):
     ):
         """
         Using our model and a specified resolution, we'll build up the lookup
-        table. Note that the defaults are recommended (<3 min) and shrinking the
-        resolutions further nonlinearly increases the process time.
+        table. The whole grid is solved at once, so the defaults take a couple
+        of seconds; memory grows with the number of grid points.
 
         Also, make sure that the resolutions are in .1, .2, or .5 increments.
 
@@ -144,23 +321,50 @@ class PVCellNonideal(PVCell):
         temperatureRes: float
             Temperature resolution step.
         """
-        lookup = Lookup(fileName=fileName)
-        for voltage in np.arange(0.00, 0.80 + voltageRes, voltageRes):
-            for irradiance in np.arange(0.00, 1000 + irradianceRes, irradianceRes):
-                for temperature in np.arange(0.00, 80 + temperatureRes, temperatureRes):
-                    # TODO: test to see if irrad, temp = 0 breaks the model.
-                    current = self.getCurrent(1, voltage, irradiance, temperature)
-                    lookup.addLine(
-                        [
-                            round(voltage, 3),
-                            round(irradiance, 3),
-                            round(temperature, 3),
-                            round(current, 3),
-                        ]
-                    )
-
-        lookup.writeFile()
-        lookup.readFile()
+        voltages = np.arange(0.00, 0.80 + voltageRes, voltageRes)
+        irradiances = np.arange(0.00, 1000 + irradianceRes, irradianceRes)
+        temperatures = np.arange(0.00, 80 + temperatureRes, temperatureRes)
+
+        # Solve every grid point at once, across cores when the kernels are
+        # compiled. Rows are ordered by voltage, then irradiance, then
+        # temperature, as the Lookup expects.
+        V, G, T = np.meshgrid(voltages, irradiances, temperatures, indexing="ij")
+        if NUMBA_AVAILABLE:
+            currents = nonidealCurrentGrid(
+                voltages,
+                irradiances,
+                temperatures,
+                PVCell.refIrrad,
+                PVCell.refSCCurrent,
+                PVCell.refOCVoltage,
+                PVCell.refTemp,
+                PVCell.k,
+                PVCell.q,
+                self.rSeries,
+                self.rShunt,
+                self.useFastExp,
+            )
+        else:
+            currents = self._solveCurrents(V, G, T)
+
+        lookup = Lookup(
+            parameters=[
+                (voltageRes, len(voltages)),
+                (irradianceRes, len(irradiances)),
+                (temperatureRes, len(temperatures)),
+            ],
+            fileName=fileName,
+        )
+        lookup.writeArray(
+            np.column_stack(
+                (
+                    V.ravel().round(3),
+                    G.ravel().round(3),
+                    T.ravel().round(3),
+                    currents.ravel().round(3),
+                )
+            )
+        )
         self._lookup = lookup
 
     def getModelType(self):
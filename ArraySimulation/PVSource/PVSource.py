@@ -205,6 +205,110 @@ class PVSource:
         else:
             raise Exception("No cell model is defined for the PVSource.")
 
+    def getModuleCurrents(self, moduleDef, voltages):
+        """
+        Calculates and returns the source model current for a specific module
+        at each voltage of an array. The "voltage" entry of moduleDef is
+        ignored.
+
+        Parameters
+        ----------
+        moduleDef: Dict
+            A dictionary for a single module, in the following format:
+
+            moduleDef = {
+                "numCells": int,
+                "voltage": float,       (V)
+                "irradiance": float,    (W/m^2)
+                "temperature": float,   (C)
+            }
+        voltages: ndarray
+            Voltages across the module.
+
+        Returns
+        -------
+        ndarray: float64 currents of the module model, one per voltage.
+        Throws an exception for undefined cell model.
+        """
+        if self._model is not None:
+            if self._useLookup:
+                return self._model.getCurrentsLookup(
+                    moduleDef["numCells"],
+                    voltages,
+                    moduleDef["irradiance"],
+                    moduleDef["temperature"],
+                )
+            else:
+                return self._model.getCurrents(
+                    moduleDef["numCells"],
+                    voltages,
+                    moduleDef["irradiance"],
+                    moduleDef["temperature"],
+                )
+        else:
+            raise Exception("No cell model is defined for the PVSource.")
+
+    def getSourceCurrents(self, modulesDef, voltages):
+        """
+        Calculates and returns the source model current at each voltage of an
+        array. The "voltage" entries of modulesDef are ignored and left
+        untouched.
+
+        Single module sources are evaluated in bulk by the cell model. Sources
+        with more than one module fall back to getSourceCurrent() at each
+        voltage.
+
+        Parameters
+        ----------
+        modulesDef: Dict
+            A dictionary for a set of modules representing the source, in the
+            same format as getSourceCurrent().
+        voltages: ndarray
+            Voltages across the source.
+
+        Returns
+        -------
+        ndarray: float64 currents of the source model, one per voltage.
+        Throws an exception for undefined cell model.
+        """
+        if self._model is not None:
+            voltages = np.asarray(voltages, dtype=np.float64)
+            if len(modulesDef) == 1:
+                (module,) = modulesDef.values()
+                currents = self.getModuleCurrents(module, voltages)
+                return currents * (
+                    1 - np.exp(-1000)  # TODO: this is a magic number for now.
+                )
+
+            currents = np.empty(voltages.shape, np.float64)
+            for idx, voltage in np.ndenumerate(voltages):
+                currents[idx] = self.getSourceCurrent(
+                    {
+                        moduleKey: dict(module, voltage=voltage)
+                        for (moduleKey, module) in modulesDef.items()
+                    }
+                )
+            return currents
+        else:
+            raise Exception("No cell model is defined for the PVSource.")
+
+    def getIVVoltages(self, numCells):
+        """
+        Returns the voltages that getIV() evaluates the source at.
+
+        Parameters
+        ----------
+        numCells: int
+            Total number of cells in the source.
+
+        Returns
+        -------
+        ndarray: float64 voltages from 0 to MAX_VOLTAGE, inclusive.
+        """
+        return np.arange(
+            0, round(PVSource.MAX_CELL_VOLTAGE * numCells, 2) + 0.01, 0.01
+        )
+
     def getIV(self, modulesDef, numCells, resolution=0.01):
         """
         TODO: implement multimodule support
@@ -244,17 +348,10 @@ class PVSource:
         """
         # We need to calculate the expected maximum voltage that can be applied
         # over all modules.
-        model = []
         if self._model is not None:
-            for voltage in np.arange(
-                0, round(PVSource.MAX_CELL_VOLTAGE * numCells, 2) + 0.01, 0.01
-            ):
-                for module in modulesDef.values():
-                    module["voltage"] = voltage
-                current = self.getSourceCurrent(modulesDef)
-                voltCurrPair = (voltage, current)
-                model.append(voltCurrPair)
-            return model
+            voltages = self.getIVVoltages(numCells)
+            currents = self.getSourceCurrents(modulesDef, voltages)
+            return list(zip(voltages.tolist(), currents.tolist()))
         else:
             raise Exception("No cell model is defined for the PVSource.")
 
@@ -292,28 +389,51 @@ class PVSource:
             and current.
         """
         if self._model is not None:
-            mpp = (0, 0)  # voltage, current list
-            OCVoltage = 0.0
-
             if resolution <= 0:
                 resolution = self.MIN_RESOLUTION
 
             model = self.getIV(modulesDef, numCells, resolution)
-
-            if model != []:
-                SCCurrent = model[0][1]  # Current in first entry
-                for (voltage, current) in model:
-                    if mpp[0] * mpp[1] < voltage * current:
-                        mpp = (voltage, current)
-                    if OCVoltage != 0.0 and current == 0:
-                        OCVoltage = voltage
-
-                return (OCVoltage, SCCurrent, mpp)
-            else:
-                return (0, 0, (0, 0))
+            return self.getEdgeCharacteristicsFromIV(model)
         else:
             raise Exception("No cell model is defined for the PVSource.")
 
+    def getEdgeCharacteristicsFromIV(self, model):
+        """
+        Calculates the source model edge characteristics from an I-V curve
+        previously generated by getIV(). Use this instead of
+        getEdgeCharacteristics() when the I-V curve is already on hand to
+        avoid regenerating it.
+
+        Parameters
+        ----------
+        model: list
+            [(voltage:float, current:float), ...]
+            A list of paired voltage|current tuples across the source IV curve.
+
+        Returns
+        -------
+        tuple: (V_OC:float, I_SC:float, (V_MPP:float, I_MPP:float)):
+            A tuple of tuples indicating the open circuit voltage, the short
+            circuit current, and the GLOBAL maximum power point (MPP) voltage
+            and current.
+        """
+        mpp = (0, 0)  # voltage, current list
+        OCVoltage = 0.0
+
+        if len(model) == 0:
+            return (0, 0, (0, 0))
+
+        SCCurrent = model[0][1]  # Current in first entry
+
+        # The MPP is the first point of maximum (positive) power.
+        IV = np.asarray(model, dtype=np.float64)
+        power = IV[:, 0] * IV[:, 1]
+        idx = int(np.argmax(power))
+        if power[idx] > 0:
+            mpp = tuple(model[idx])
+
+        return (OCVoltage, SCCurrent, mpp)
+
     def getModelType(self):
         """
         Returns the model type used for each PVCell in PVSource.
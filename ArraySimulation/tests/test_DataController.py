@@ -0,0 +1,229 @@
+"""
+test_DataController.py
+
+Author: agent
+Contact: agent@local
+Created: 10/14/26
+Last Modified: 10/14/26
+
+Description: Test file to see if the DataController pipeline records the same
+results as running the pipeline components by hand.
+"""
+# Library Imports.
+import numpy as np
+import sys
+
+sys.path.append("../")
+
+# Custom Imports.
+from ArraySimulation.Controller.DataController import DataController
+from ArraySimulation.DCDCConverter.DCDCConverter import DCDCConverter
+from ArraySimulation.MPPT.MPPT import MPPT
+from ArraySimulation.MPPT.MPPTTypes import GlobalMPPTType, LocalMPPTType, StrideType
+from ArraySimulation.PVEnvironment.PVEnvironment import PVEnvironment
+from ArraySimulation.PVSource.PVSource import PVSource
+
+
+def runReferencePipeline(environment, maxCycles):
+    """
+    Runs the MPPT pipeline component by component, the way the DataController
+    does, and collects the results of each cycle in lists.
+    """
+    env = PVEnvironment()
+    env.setupModel(source=environment, maxCycles=maxCycles)
+    source = PVSource()
+    source.setupModel(modelType="Nonideal")
+    mppt = MPPT()
+    mppt.setupModel(
+        numCells=env.getSourceNumCells(),
+        MPPTGlobalAlgoType=GlobalMPPTType.VOLTAGE_SWEEP,
+        MPPTLocalAlgoType=LocalMPPTType.PANDO,
+        strideType=StrideType.FIXED,
+    )
+    dcdc = DCDCConverter()
+    numCells = env.getSourceNumCells()
+
+    results = {
+        "cycle": [],
+        "sourceDef": [],
+        "current": [],
+        "IV": [],
+        "edge": [],
+        "vRef": [],
+        "pulseWidth": [],
+    }
+    vREF = 0.0
+    continueBool = True
+    while continueBool:
+        cycle = env.getCycle()
+        modulesDef = env.getSourceDefinition(vREF)
+        envDef = env.getSourceEnvironmentDefinition()
+
+        current = source.getSourceCurrent(modulesDef)
+        IV = source.getIV(modulesDef, numCells)
+        edge = source.getEdgeCharacteristics(modulesDef, numCells)
+        vRef = mppt.getReferenceVoltage(
+            vREF, current, envDef["irradiance"], envDef["temperature"]
+        )
+        dcdc.setPulseWidth(vRef)
+
+        results["cycle"].append(cycle)
+        results["sourceDef"].append(
+            [
+                [module["voltage"], module["irradiance"], module["temperature"]]
+                for module in modulesDef.values()
+            ]
+        )
+        results["current"].append(current)
+        results["IV"].append(IV)
+        results["edge"].append([edge[0], edge[1], edge[2][0], edge[2][1]])
+        results["vRef"].append(vRef)
+        results["pulseWidth"].append(dcdc.getPulseWidth())
+
+        vREF = vRef
+        continueBool = env.incrementCycle()
+
+    return results
+
+
+class TestDataController:
+    def test_DataControllerMPPT(self):
+        """
+        Testing whether stepping the MPPT simulation fills the datastore with
+        the results of each cycle.
+        """
+        # Long enough to pass through the temperature steps of the profile.
+        environment = "SingleCell.json"
+        maxCycles = 300
+        controller = DataController()
+        controller.resetPipeline(
+            "Nonideal",
+            environment,
+            maxCycles,
+            GlobalMPPTType.VOLTAGE_SWEEP,
+            LocalMPPTType.PANDO,
+            StrideType.FIXED,
+        )
+
+        # Nothing is recorded before the first cycle.
+        assert len(controller.getCycles()) == 0
+
+        continueBool = True
+        while continueBool:
+            (datastore, continueBool) = controller.iteratePipelineCycleMPPT()
+        reference = runReferencePipeline(environment, maxCycles)
+
+        numCycles = len(reference["cycle"])
+        assert numCycles == maxCycles + 1
+
+        # Shapes and types of each column.
+        cycles = controller.getCycles()
+        assert cycles.dtype == np.int32 and cycles.shape == (numCycles,)
+        for column in [
+            controller.getCurrents(),
+            controller.getReferenceVoltages(),
+            controller.getPulseWidths(),
+        ]:
+            assert column.dtype == np.float32 and column.shape == (numCycles,)
+        edge = controller.getEdgeCharacteristics()
+        assert edge.dtype == np.float32 and edge.shape == (numCycles, 4)
+        sourceDef = controller.getSourceDefinitions()
+        assert sourceDef.dtype == np.float32
+        assert sourceDef.shape == (numCycles, 1, 3)
+
+        # Values of each column, as stored in float32.
+        assert cycles.tolist() == reference["cycle"]
+        for (column, values) in [
+            (controller.getCurrents(), reference["current"]),
+            (controller.getReferenceVoltages(), reference["vRef"]),
+            (controller.getPulseWidths(), reference["pulseWidth"]),
+            (edge, reference["edge"]),
+            (sourceDef, reference["sourceDef"]),
+        ]:
+            assert np.array_equal(column, np.asarray(values, dtype=np.float32))
+
+        for cycle in range(numCycles):
+            IV = controller.getSourceIV(cycle)
+            assert IV.dtype == np.float32
+            assert np.array_equal(
+                IV, np.asarray(reference["IV"][cycle], dtype=np.float32)
+            )
+
+        # The getters are views of the datastore.
+        assert np.shares_memory(cycles, datastore["cycle"])
+        assert np.shares_memory(
+            controller.getReferenceVoltages(), datastore["mpptOutput"]
+        )
+
+    def test_DataControllerRunMPPT(self):
+        """
+        Testing whether running the MPPT simulation in one call records the
+        same results as stepping through it cycle by cycle.
+        """
+        maxCycles = 300
+        resetArgs = (
+            "Nonideal",
+            "SingleCell.json",
+            maxCycles,
+            GlobalMPPTType.VOLTAGE_SWEEP,
+            LocalMPPTType.IC,
+            StrideType.ADAPTIVE,
+        )
+        stepped = DataController()
+        batched = DataController()
+        resumed = DataController()
+        for controller in [stepped, batched, resumed]:
+            controller.resetPipeline(*resetArgs)
+
+        continueBool = True
+        while continueBool:
+            (_, continueBool) = stepped.iteratePipelineCycleMPPT()
+
+        datastore = batched.runPipelineMPPT()
+
+        # A batch run picks up where stepping left off.
+        for _ in range(10):
+            resumed.iteratePipelineCycleMPPT()
+        resumed.runPipelineMPPT()
+
+        assert datastore is batched.datastore
+        for controller in [batched, resumed]:
+            assert len(controller.getCycles()) == maxCycles + 1
+            for getter in [
+                "getCycles",
+                "getCurrents",
+                "getReferenceVoltages",
+                "getPulseWidths",
+                "getEdgeCharacteristics",
+                "getSourceDefinitions",
+            ]:
+                assert np.array_equal(
+                    getattr(controller, getter)(), getattr(stepped, getter)()
+                )
+            for cycle in range(maxCycles + 1):
+                assert np.array_equal(
+                    controller.getSourceIV(cycle), stepped.getSourceIV(cycle)
+                )
+
+    def test_DataControllerSourceCurve(self):
+        """
+        Testing whether source curves are memoized on the parameters that
+        change the curve.
+        """
+        controller = DataController()
+        curve = controller.generateSourceCurve(1, 1000, 25, 0.01, "Nonideal", False)
+        (voltages, currents) = curve
+        assert voltages.dtype == np.float32 and currents.dtype == np.float32
+        assert not voltages.flags.writeable and not currents.flags.writeable
+
+        # The voltage resolution does not change the curve, so it is reused.
+        assert (
+            controller.generateSourceCurve(1, 1000.0001, 25, 0.1, "Nonideal", False)
+            is curve
+        )
+        assert controller._sourceCurveCache.cache_info().misses == 1
+
+        other = controller.generateSourceCurve(1, 800, 25, 0.01, "Nonideal", False)
+        assert other is not curve
+        assert np.array_equal(other[0], voltages)
+        assert not np.array_equal(other[1], currents)
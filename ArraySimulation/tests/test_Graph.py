@@ -0,0 +1,194 @@
+"""
+test_Graph.py
+
+Author: agent
+Contact: agent@local
+Created: 10/14/26
+Last Modified: 10/14/26
+
+Description: Test file to see if the Graph series buffers hold and redraw the
+data points given to them. Runs on the offscreen Qt platform, so no display is
+needed.
+"""
+# Library Imports.
+import os
+import numpy as np
+import pytest
+import sys
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from PyQt5.QtTest import QTest
+from PyQt5.QtWidgets import QApplication
+
+sys.path.append("../")
+
+# Custom Imports.
+from ArraySimulation.Controller.Graph import Graph
+
+# Widgets can only be built once a QApplication exists.
+app = QApplication.instance() or QApplication(sys.argv)
+
+
+def makeGraph(graphType="Line"):
+    """
+    Builds a graph with a scaled series that has initial data and an empty
+    series.
+    """
+    return Graph(
+        graphType=graphType,
+        series={
+            "voltage": {
+                "data": {"x": [0, 1, 2], "y": [0.5, 0.6, 0.7]},
+                "multiplier": 2,
+                "label": "Voltage (V)",
+                "color": (255, 0, 0),
+            },
+            "current": {
+                "data": {"x": [], "y": []},
+                "multiplier": 1,
+                "label": None,
+                "color": (0, 255, 0),
+            },
+            "list": ["voltage", "current"],
+        },
+    )
+
+
+def getPlotted(graph, series):
+    """
+    Returns the x and y data last pushed to the plot item of a series.
+    """
+    (x, y) = graph._graph[graph._seriesIndex[series]].getData()
+    if x is None:
+        return ([], [])
+    return (list(x), list(y))
+
+
+class TestGraph:
+    def test_GraphInitialData(self):
+        """
+        Testing whether the initial data of each series is copied into the
+        buffers, scaled, and plotted.
+        """
+        graph = makeGraph()
+
+        i = graph._seriesIndex["voltage"]
+        assert graph._counts[i] == 3
+        assert graph._bufX[i].dtype == np.float32
+        assert len(graph._bufX[i]) == Graph._BUFFER_CAPACITY
+        assert getPlotted(graph, "voltage") == (
+            [0, 1, 2],
+            list(np.float32([0.5, 0.6, 0.7]) * 2),
+        )
+        assert getPlotted(graph, "current") == ([], [])
+
+    def test_GraphAddPoint(self):
+        """
+        Testing whether single data points are appended past the initial buffer
+        capacity.
+        """
+        graph = makeGraph()
+        numPoints = 2 * Graph._BUFFER_CAPACITY + 1
+
+        for x in range(3, numPoints):
+            graph.addPoint("voltage", x, x / 10)
+        for x in range(numPoints):
+            graph.addPoint("current", x, -x)
+        graph.addPoint("missing", 0, 0)
+
+        i = graph._seriesIndex["voltage"]
+        assert graph._counts[i] == numPoints
+        assert len(graph._bufX[i]) >= numPoints
+        (x, y) = graph._getData(i)
+        assert x.tolist() == list(range(numPoints))
+        assert y[3:].tolist() == [np.float32(x / 10) * 2 for x in range(3, numPoints)]
+
+        # The initial data survives growing the buffers.
+        assert y[:3].tolist() == list(np.float32([0.5, 0.6, 0.7]) * 2)
+
+        (x, y) = graph._getData(graph._seriesIndex["current"])
+        assert y.tolist() == [-x for x in range(numPoints)]
+
+    def test_GraphAddPoints(self):
+        """
+        Testing whether batches of data points are appended past the initial
+        buffer capacity.
+        """
+        graph = makeGraph()
+        numPoints = 3 * Graph._BUFFER_CAPACITY
+
+        graph.addPoints("voltage", [3, 4], [0.8, 0.9])
+        graph.addPoints("voltage", np.arange(5, numPoints), np.ones(numPoints - 5))
+        graph.addPoints("voltage", [], [])
+        graph.addPoints("missing", [0], [0])
+
+        (x, y) = graph._getData(graph._seriesIndex["voltage"])
+        assert x.tolist() == list(range(numPoints))
+        assert y.tolist() == (
+            list(np.float32([0.5, 0.6, 0.7, 0.8, 0.9]) * 2) + [2] * (numPoints - 5)
+        )
+
+    def test_GraphClear(self):
+        """
+        Testing whether clearing series drops their data points, and whether
+        points can be added again afterwards.
+        """
+        graph = makeGraph()
+        graph.addPoint("current", 0, 1)
+
+        graph.clearSeries("voltage")
+        assert graph._counts[graph._seriesIndex["voltage"]] == 0
+        assert graph._counts[graph._seriesIndex["current"]] == 1
+
+        graph.addPoint("voltage", 5, 1)
+        graph.flushNow()
+        assert getPlotted(graph, "voltage") == ([5], [2])
+
+        graph.clearAllSeries()
+        graph.flushNow()
+        assert getPlotted(graph, "voltage") == ([], [])
+        assert getPlotted(graph, "current") == ([], [])
+
+    def test_GraphFlush(self):
+        """
+        Testing whether updates are only redrawn on a flush, either immediately
+        with flushNow or by the flush timer.
+        """
+        for graphType in ["Line", "Scatter"]:
+            graph = makeGraph(graphType)
+            plotted = getPlotted(graph, "voltage")
+
+            # Updates are held until the next flush.
+            graph.addPoint("voltage", 3, 0.8)
+            graph.addPoints("current", [0, 1], [1, 2])
+            assert getPlotted(graph, "voltage") == plotted
+            assert getPlotted(graph, "current") == ([], [])
+
+            graph.flushNow()
+            assert graph._dirty == set()
+            assert getPlotted(graph, "voltage")[0] == [0, 1, 2, 3]
+            assert getPlotted(graph, "current") == ([0, 1], [1, 2])
+
+            # The flush timer redraws without an explicit flush.
+            graph.addPoint("current", 2, 3)
+            QTest.qWait(int(3 * Graph._SECOND / graph._framerate))
+            assert graph._dirty == set()
+            assert getPlotted(graph, "current") == ([0, 1, 2], [1, 2, 3])
+
+    def test_GraphSetPoint(self):
+        """
+        Testing whether setPoint replaces a single valid data point as given,
+        and rejects indices past the valid data points.
+        """
+        graph = makeGraph()
+        graph.setPoint("voltage", 1, 10, 0.25)
+        graph.setPoint("voltage", -1, 20, 0.5)
+        graph.setPoint("missing", 0, 0, 0)
+        graph.flushNow()
+        assert getPlotted(graph, "voltage") == ([0, 10, 20], [1, 0.25, 0.5])
+
+        for idx in [3, -4]:
+            with pytest.raises(IndexError):
+                graph.setPoint("voltage", idx, 0, 0)
+        with pytest.raises(IndexError):
+            graph.setPoint("current", 0, 0, 0)
@@ -10,6 +10,8 @@ Description: Test file to see if we can extract from a pre generated model file
 and write to a new file using the Lookup class.
 """
 # Library Imports.
+import numpy as np
+import os
 import pytest
 import sys
 
@@ -80,3 +82,198 @@ class TestLookup:
             assert lookup.lookup([0.0, 0.0, 2.5]) == [0.6]
         except Exception as e:
             pytest.fail(str(e))
+
+    def test_LookupArray(self):
+        """
+        Testing whether the vectorized lookup returns the same outputs and
+        errors as the scalar lookup.
+        """
+        lookup = Lookup(fileName="NonidealCellLookup.csv")
+        lookup.readFile()
+
+        voltages = np.round(np.arange(0, 0.81, 0.05), 2)
+        irradiances = np.array([0.001, 50, 475, 1000])
+        temperatures = np.array([0.001, 25.5, 80.0])
+        V, G, T = np.meshgrid(voltages, irradiances, temperatures, indexing="ij")
+
+        outputs = lookup.lookupArray([V, G, T])
+        assert outputs.shape == (V.size, 1)
+        for idx, (voltage, irradiance, temperature) in enumerate(
+            zip(V.ravel(), G.ravel(), T.ravel())
+        ):
+            assert outputs[idx].tolist() == lookup.lookup(
+                [voltage, irradiance, temperature]
+            )
+
+        # Scalars broadcast against arrays.
+        assert lookup.lookupArray([voltages, 1000, 25.5])[:, 0].tolist() == [
+            lookup.lookup([voltage, 1000, 25.5])[0] for voltage in voltages
+        ]
+
+        # Out of bounds data raises the same exception as the scalar lookup.
+        for params in [[0.2, 1000, 80.5], [0.2, 1050, 80.3]]:
+            with pytest.raises(Exception) as expected:
+                lookup.lookup(params)
+            with pytest.raises(Exception) as excinfo:
+                lookup.lookupArray([[0.1, params[0]], params[1], params[2]])
+            assert str(excinfo.value) == str(expected.value)
+
+    def test_LookupCache(self, tmp_path):
+        """
+        Testing whether the .npz cache of a file is used while it matches the
+        file, and rebuilt when the file is replaced or the cache is in an old
+        format.
+        """
+        lookup = Lookup(
+            parameters=[(1, 2), (1, 3)],
+            header=["a", "b", "output"],
+            fileName="TestLookupCache.csv",
+        )
+        lookup._fileRoot = str(tmp_path) + "/"
+        fileName = lookup._fileRoot + lookup._filename
+        cacheName = fileName + ".npz"
+
+        def writeTable(outputs):
+            writer = Lookup(
+                parameters=[(1, 2), (1, 3)],
+                header=["a", "b", "output"],
+                fileName="TestLookupCache.csv",
+            )
+            writer._fileRoot = lookup._fileRoot
+            for a in range(2):
+                for b in range(3):
+                    writer.addLine([a, b, outputs[a * 3 + b]])
+            writer.writeFile()
+
+        writeTable([0.1, 0.2, 0.3, 0.4, 0.5, 0.6])
+        lookup.readFile()
+        assert os.path.exists(cacheName)
+        assert lookup.lookup([1, 2]) == [0.6]
+
+        # A cache matching the file is used instead of the file.
+        fileStat = os.stat(fileName)
+        np.savez(
+            cacheName,
+            values=np.full((6, 1), 0.7),
+            scale=1,
+            fileSize=fileStat.st_size,
+            fileMtime=fileStat.st_mtime_ns,
+        )
+        lookup.readFile()
+        assert lookup.lookup([1, 2]) == [0.7]
+
+        # A file replaced by an older one is read again, even though the cache
+        # is newer than it.
+        writeTable([1.1, 1.2, 1.3, 1.4, 1.5, 1.6])
+        os.utime(fileName, ns=(0, 0))
+        lookup.readFile()
+        assert lookup.lookup([1, 2]) == [1.6]
+        with np.load(cacheName) as cache:
+            assert cache["fileMtime"] == 0
+
+        # So is a file of another size with the same modification time.
+        writeTable([1.1, 1.2, 1.3, 1.4, 1.5, 10.6])
+        os.utime(fileName, ns=(0, 0))
+        lookup.readFile()
+        assert lookup.lookup([1, 2]) == [10.6]
+
+        # A cache in an old format, without the file status, is rebuilt.
+        np.savez(cacheName, values=np.zeros((6, 1)), scale=1)
+        lookup.readFile()
+        assert lookup.lookup([1, 2]) == [10.6]
+        with np.load(cacheName) as cache:
+            assert "fileSize" in cache and "fileMtime" in cache
+
+        # Reading the file leaves the lines buffered for writing alone.
+        lookup.addLine([0, 0, 0.1])
+        lookup.readFile()
+        assert lookup._buffer == [[0, 0, 0.1]]
+
+    def test_LookupFixedPoint(self, tmp_path):
+        """
+        Testing whether outputs stored in fixed point read back as the exact
+        floats parsed from the file, and whether tables that do not fit fall
+        back to wider storage.
+        """
+        cases = [
+            # Outputs with at most 3 decimals fit in int16.
+            (["0", "0.001", "-0.001", "3.162", "6.146", "32.767"], np.int16),
+            # Outputs past the int16 range fall back to int32.
+            (["0", "0.001", "32.768", "-40.5", "1000.125", "6.146"], np.int32),
+            # Outputs with more than 3 decimals are kept as float64.
+            (["0", "0.0001", "3.1623", "6.146", "1e-7", "0.333333"], np.float64),
+        ]
+        for idx, (outputs, dtype) in enumerate(cases):
+            lookup = Lookup(
+                parameters=[(1, 6)],
+                header=["a", "output"],
+                fileName="TestLookupFixedPoint" + str(idx) + ".csv",
+            )
+            lookup._fileRoot = str(tmp_path) + "/"
+            for a, output in enumerate(outputs):
+                lookup.addLine([a, output])
+            lookup.writeFile()
+            lookup.readFile()
+
+            assert lookup._values.dtype == dtype
+            for a, output in enumerate(outputs):
+                assert lookup.lookup([a]) == [float(output)]
+            assert lookup.lookupArray([np.arange(6)])[:, 0].tolist() == [
+                float(output) for output in outputs
+            ]
+
+        # The shipped table reads back exactly as parsed from its text.
+        lookup = Lookup(fileName="NonidealCellLookup.csv")
+        lookup.readFile()
+        parsed = np.loadtxt(
+            lookup._fileRoot + lookup._filename, delimiter=",", skiprows=1, ndmin=2
+        )
+        assert lookup._values.dtype == np.int16
+        assert np.array_equal(lookup._values / lookup._scale, parsed[:, 3:])
+
+    def test_LookupWriteArray(self, tmp_path):
+        """
+        Testing whether a table written from an array reads back from the file
+        the same as the table kept in memory.
+        """
+        rng = np.random.default_rng(0)
+        outputs = [
+            # Outputs with 3 decimals, as buildCurrentLookup() writes.
+            np.round(rng.uniform(0, 6.2, 24), 3),
+            # Outputs that need every digit to round trip.
+            rng.uniform(0, 6.2, 24),
+        ]
+        for idx, output in enumerate(outputs):
+            A, B = np.meshgrid(np.arange(4) * 0.5, np.arange(6) * 50.0, indexing="ij")
+            data = np.column_stack((A.ravel(), B.ravel(), output))
+
+            writer = Lookup(
+                parameters=[(0.5, 4), (50, 6)],
+                header=["a", "b", "output"],
+                fileName="TestLookupWriteArray" + str(idx) + ".csv",
+            )
+            writer._fileRoot = str(tmp_path) + "/"
+            writer.writeArray(data)
+
+            # The file holds the rows that were written.
+            fileName = writer._fileRoot + writer._filename
+            parsed = np.loadtxt(fileName, delimiter=",", skiprows=1, ndmin=2)
+            assert np.array_equal(parsed, data)
+
+            # A fresh parse of the file, without the cache, matches the
+            # written table.
+            os.remove(fileName + ".npz")
+            reader = Lookup(
+                parameters=[(0.5, 4), (50, 6)],
+                header=["a", "b", "output"],
+                fileName=writer._filename,
+            )
+            reader._fileRoot = writer._fileRoot
+            reader.readFile()
+            assert reader._values.dtype == writer._values.dtype
+            assert np.array_equal(reader._values, writer._values)
+            assert reader._scale == writer._scale
+            assert np.array_equal(
+                reader.lookupArray([A, B]), writer.lookupArray([A, B])
+            )
+            assert reader.lookupArray([A, B])[:, 0].tolist() == output.tolist()
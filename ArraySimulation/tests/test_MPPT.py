@@ -0,0 +1,55 @@
+"""
+test_MPPT.py
+
+Author: agent
+Contact: agent@local
+Created: 10/14/26
+Last Modified: 10/14/26
+
+Description: Test file to see if the MPPT sets up the model types it is given.
+"""
+# Library Imports.
+import pytest
+import sys
+
+sys.path.append("../")
+
+# Custom Imports.
+from ArraySimulation.MPPT.MPPT import MPPT
+from ArraySimulation.MPPT.LocalMPPTAlgorithms.PandO import PandO
+from ArraySimulation.MPPT.MPPTComponents.AdaptiveStride import AdaptiveStride
+from ArraySimulation.MPPT.MPPTTypes import GlobalMPPTType, LocalMPPTType, StrideType
+
+
+class TestMPPT:
+    def test_MPPTTypes(self):
+        """
+        Testing whether model types can be given as types, integer values, or
+        display names.
+        """
+        for args in [
+            (GlobalMPPTType.VOLTAGE_SWEEP, LocalMPPTType.PANDO, StrideType.ADAPTIVE),
+            (1, 1, 1),
+            ("Voltage Sweep", "PandO", "Adaptive"),
+        ]:
+            mppt = MPPT()
+            mppt.setupModel(1, *args)
+            assert mppt.getGlobalMPPTType() is GlobalMPPTType.VOLTAGE_SWEEP
+            assert mppt.getLocalMPPTType() is LocalMPPTType.PANDO
+            assert mppt.getStrideType() is StrideType.ADAPTIVE
+            assert isinstance(mppt._model._model, PandO)
+            assert isinstance(mppt._model._model._strideModel, AdaptiveStride)
+
+    def test_MPPTInvalidTypes(self):
+        """
+        Testing whether unknown model types are rejected instead of falling
+        back to the default models.
+        """
+        for args in [
+            ("Sweep", "PandO", "Adaptive"),
+            ("Voltage Sweep", "P&O", "Adaptive"),
+            ("Voltage Sweep", "PandO", "Default"),
+            (GlobalMPPTType.DEFAULT, 10, StrideType.FIXED),
+        ]:
+            with pytest.raises(Exception):
+                MPPT().setupModel(1, *args)
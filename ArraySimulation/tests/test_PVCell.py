@@ -9,6 +9,7 @@ Last Modified: 11/24/20
 Description: Test file to see if the various implemented models run as expected.
 """
 # Library Imports.
+import math
 import numpy as np
 import pytest
 import sys
@@ -19,6 +20,7 @@ sys.path.append("../")
 from ArraySimulation.PVSource.PVCell.PVCell import PVCell
 from ArraySimulation.PVSource.PVCell.PVCellIdeal import PVCellIdeal
 from ArraySimulation.PVSource.PVCell.PVCellNonideal import PVCellNonideal
+from ArraySimulation.PVSource.PVCell.PVCellKernels import fastExp
 
 
 class TestPVCell:
@@ -136,6 +138,89 @@ class TestPVCell:
         except Exception as e:
             pytest.fail(str(e))
 
+    def test_PVCellNonidealBatch(self):
+        """
+        Test that the batched IV curves match the individual IV curves of the
+        Nonideal Cell Model, with and without the lookup.
+        """
+        voltages = np.round(np.arange(0, 0.81, 0.01), 2)
+        irradiances = np.array([200, 600, 1000])
+        temperatures = np.array([0, 25, 50])
+
+        for useLookup in [True, False]:
+            cell = PVCellNonideal(useLookup)
+            model = cell.getCellIVBatch(1, voltages, irradiances, temperatures)
+            assert model.shape == (3, 3, len(voltages), 2)
+
+            for gIdx, irradiance in enumerate(irradiances):
+                for tIdx, temperature in enumerate(temperatures):
+                    curve = cell.getCellIV(1, 0.01, irradiance, temperature)
+                    assert np.array_equal(model[gIdx, tIdx, :, 0], voltages)
+                    assert np.array_equal(
+                        np.round(model[gIdx, tIdx, :, 1], 3),
+                        [current for (_, current) in curve[: len(voltages)]],
+                    )
+
+    def test_PVCellNonidealFallback(self):
+        """
+        Test that the Nonideal Cell Model still solves when Newton's method
+        does not converge. With a large series resistance the exponent blows
+        up and the solver has to fall back to bisection.
+        """
+        cell = PVCellNonideal(False)
+        cell.rSeries = 5.0
+
+        for voltage in [0.0, 0.3, 0.6]:
+            current = cell.getCurrent(1, voltage, 1000, 25)
+            assert np.isfinite(current)
+            assert current >= 0
+            assert current < PVCellNonideal(False).getCurrent(1, voltage, 1000, 25)
+
+        # The vectorized solver should fall back the same way.
+        voltages = np.array([0.0, 0.3, 0.6])
+        assert np.allclose(
+            cell._solveCurrents(voltages, 1000, 25),
+            [cell.getCurrent(1, voltage, 1000, 25) for voltage in voltages],
+            rtol=0,
+            atol=1e-12,
+        )
+
+    def test_PVCellFastExp(self):
+        """
+        Test that the approximate exp() of the Nonideal solver stays within its
+        stated relative error over, and past, the range of the diode exponent.
+        """
+        for x in np.linspace(-50, 50, 20001):
+            assert abs(fastExp(x) / math.exp(x) - 1) < 1.9e-9
+
+    def test_PVCellNonidealFastExp(self):
+        """
+        Test that the Nonideal Cell Model solves the same currents with and
+        without fastExp().
+        """
+        voltages = np.round(np.arange(0, 0.81, 0.01), 2)
+        irradiances = np.array([0, 200, 600, 1000])
+        temperatures = np.array([0, 25, 50, 80])
+        cell = PVCellNonideal(False)
+        fastCell = PVCellNonideal(False, useFastExp=True)
+
+        for voltage in voltages:
+            assert fastCell.getCurrent(1, voltage, 1000, 25) == pytest.approx(
+                cell.getCurrent(1, voltage, 1000, 25), rel=0, abs=1e-6
+            )
+        assert np.allclose(
+            fastCell.getCurrents(1, voltages, 600, 50),
+            cell.getCurrents(1, voltages, 600, 50),
+            rtol=0,
+            atol=1e-6,
+        )
+        assert np.allclose(
+            fastCell.getCellIVBatch(1, voltages, irradiances, temperatures),
+            cell.getCellIVBatch(1, voltages, irradiances, temperatures),
+            rtol=0,
+            atol=1e-6,
+        )
+
     # NOTE: We can use this test to generate our models for us.
     @pytest.mark.additional
     def test_PVCellNonidealBuildLookupLong(self):